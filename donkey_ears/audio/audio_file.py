@@ -10,17 +10,22 @@ class AudioFile(BaseAudioSource):
     def __init__(self, filepath: Union[str, Path]):
         self.filepath = Path(filepath)
         self._audio_data = AudioSegment.from_file(filepath)
+        self._raw_data = memoryview(self._audio_data.raw_data)
         self.frame_index = 0
 
-    def __max_audio_frames(self) -> int:
-        return int(self._audio_data.frame_count())
+        # The audio never changes after loading, so cache the values needed on every read
+        self._max_audio_frames = int(self._audio_data.frame_count())
+        self._frame_rate = self._audio_data.frame_rate
+        self._frame_width = self._audio_data.frame_width
+        self._sample_width = self._audio_data.sample_width
+        self._n_channels = self._audio_data.channels
 
     def jump_to_frame(self, frame_number: int):
         if not isinstance(frame_number, int):
             raise TypeError(f"`frame_number` must be an integer, received {frame_number!r} (type={type(frame_number)})")
-        if frame_number < 0 or frame_number >= self.__max_audio_frames():
+        if frame_number < 0 or frame_number >= self._max_audio_frames:
             raise ValueError(
-                f"`frame_number` must be an integer between 0 and {self.__max_audio_frames()} (the number of frames in the file), received {frame_number!r}"
+                f"`frame_number` must be an integer between 0 and {self._max_audio_frames} (the number of frames in the file), received {frame_number!r}"
             )
 
         self.frame_index = frame_number
@@ -30,14 +35,14 @@ class AudioFile(BaseAudioSource):
 
     @property
     def frame_rate(self) -> int:
-        return self._audio_data.frame_rate
+        return self._frame_rate
 
     def read_pydub(self, n_frames: Optional[int]) -> AudioSegment:
-        if self.frame_index >= self.__max_audio_frames():
+        if self.frame_index >= self._max_audio_frames:
             raise EOFError("Attempted to read past the end of the audio file.")
 
         if n_frames is None:
-            n_frames = self.__max_audio_frames() - self.frame_index
+            n_frames = self._max_audio_frames - self.frame_index
         if not isinstance(n_frames, int):
             raise TypeError(
                 f"`n_frames` must be an integer greater than zero, received {n_frames!r} (type={type(n_frames)})"
@@ -45,7 +50,15 @@ class AudioFile(BaseAudioSource):
         if n_frames == 0:
             raise ValueError(f"`n_frames` must be an integer greater than zero, received {n_frames!r}")
 
-        read_data = self._audio_data.get_sample_slice(self.frame_index, self.frame_index + n_frames)
+        # Slice the raw data directly; only the bytes for the frames read are copied
+        start_byte = self.frame_index * self._frame_width
+        end_byte = (self.frame_index + n_frames) * self._frame_width
+        read_data = AudioSegment(
+            self._raw_data[start_byte:end_byte].tobytes(),
+            sample_width=self._sample_width,
+            frame_rate=self._frame_rate,
+            channels=self._n_channels,
+        )
         self.frame_index += n_frames
         return read_data
 
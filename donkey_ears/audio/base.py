@@ -1,4 +1,6 @@
+import functools
 import io
+import math
 from array import array
 from typing import Iterable, Optional, Tuple, Union
 
@@ -12,9 +14,22 @@ TimeType = Union[float, int]
 
 
 class AudioSample:  # pylint: disable=too-many-public-methods
+    # Values computed from the audio data that are cached on first access (and cleared if ``data`` is replaced)
+    _CACHED_PROPERTIES = ("n_frames", "n_seconds", "sum_of_squares", "rms")
+
     def __init__(self, data: AudioSegment):
         self.data = data
 
+    @property
+    def data(self) -> AudioSegment:
+        return self._data
+
+    @data.setter
+    def data(self, data: AudioSegment) -> None:
+        self._data = data
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
     def __eq__(self, other) -> bool:
         """
         Returns True if other object is an ``AudioSample`` object and they have the same data.
@@ -30,14 +45,14 @@ class AudioSample:  # pylint: disable=too-many-public-methods
         """
         return self.n_frames
 
-    @property
+    @functools.cached_property
     def n_frames(self) -> int:
         """
         The number of frames in the audio sample.
         """
         return int(self.data.frame_count())
 
-    @property
+    @functools.cached_property
     def n_seconds(self) -> float:
         """
         The number of seconds in the audio sample.
@@ -155,11 +170,40 @@ class AudioSample:  # pylint: disable=too-many-public-methods
         return self.data.sample_width
 
     @property
+    def n_samples(self) -> int:
+        """
+        The number of samples in the audio sample (i.e. the number of frames times the number of channels).
+        """
+        return self.n_frames * self.n_channels
+
+    @functools.cached_property
+    def sum_of_squares(self) -> Union[int, float]:
+        """
+        The sum of every sample squared.  It's an exact integer for samples up to 16 bits wide; wider samples are summed
+        as floats so the total can't overflow.
+        """
+        if self.sample_width <= 2:
+            samples = self.to_numpy().astype(np.int64)
+            return int(np.dot(samples, samples))
+        samples = self.to_numpy().astype(np.float64)
+        return float(np.dot(samples, samples))
+
+    @functools.cached_property
     def rms(self) -> int:
         """
         A measure of the loudness or energy in the audio.
         """
-        return self.data.rms
+        n_samples = self.n_samples
+        if n_samples == 0:
+            return 0
+        return int(math.sqrt(self.sum_of_squares / n_samples))
+
+    def rms_exceeds(self, threshold: float) -> bool:
+        """
+        Return whether the (unrounded) rms of the audio is greater than ``threshold``.  This is cheaper than comparing
+        against ``rms`` since no square root is needed.
+        """
+        return self.sum_of_squares > threshold * threshold * self.n_samples
 
     @property
     def max_possible_amplitude(self) -> float:
@@ -177,7 +221,16 @@ class AudioSample:  # pylint: disable=too-many-public-methods
         """
         Convert the audio sample into a new audio sample with a different frame rate, sample width, and/or number of
         channels.
+
+        If the audio sample is already in the requested format, it is returned as-is.
         """
+        if (
+            (frame_rate is None or frame_rate == self.frame_rate)
+            and (sample_width is None or sample_width == self.sample_width)
+            and (n_channels is None or n_channels == self.n_channels)
+        ):
+            return self
+
         new_data = self.data
 
         if frame_rate is not None:
@@ -226,14 +279,38 @@ class AudioSample:  # pylint: disable=too-many-public-methods
         Create an audio sample by concatenating ``audio_samples`` together.
 
         If ``crossfade`` is not zero, then it represents the amount of overlap (in seconds) of the two audio sample.
-        """
-        final_sample = None
-        for sample in audio_samples:
-            if final_sample is None:
-                final_sample = sample
-            else:
-                final_sample = final_sample.append(sample, crossfade=crossfade)
-        return final_sample
+
+        Returns ``None`` if ``audio_samples`` is empty.
+        """
+        if crossfade:
+            final_sample = None
+            for sample in audio_samples:
+                if final_sample is None:
+                    final_sample = sample
+                else:
+                    final_sample = final_sample.append(sample, crossfade=crossfade)
+            return final_sample
+
+        # Without a crossfade, join the raw data once instead of repeatedly appending (which copies the growing sample
+        # on every append).  Like pydub's append, the samples are first brought to a common format.
+        segments = [sample.data for sample in audio_samples]
+        if len(segments) == 0:
+            return None
+
+        frame_rate = max(segment.frame_rate for segment in segments)
+        sample_width = max(segment.sample_width for segment in segments)
+        n_channels = max(segment.channels for segment in segments)
+        return AudioSample(
+            AudioSegment(
+                b"".join(
+                    segment.set_frame_rate(frame_rate).set_sample_width(sample_width).set_channels(n_channels).raw_data
+                    for segment in segments
+                ),
+                frame_rate=frame_rate,
+                sample_width=sample_width,
+                channels=n_channels,
+            )
+        )
 
     @classmethod
     def generate_silence(cls, n_seconds: TimeType, frame_rate: int) -> "AudioSample":
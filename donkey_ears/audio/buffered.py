@@ -0,0 +1,183 @@
+import math
+import queue
+import threading
+from typing import List, Optional, Tuple
+
+from pydub import AudioSegment
+
+from donkey_ears.audio.base import AudioSample, BaseAudioSource, TimeType
+
+
+class SourceRunningError(Exception):
+    pass
+
+
+def _split_sample(audio: AudioSample, n_frames: int) -> Tuple[AudioSample, Optional[AudioSample]]:
+    """
+    Split ``audio`` into the first ``n_frames`` frames and the rest (``None`` if there aren't any frames left over).
+    """
+    if n_frames >= audio.n_frames:
+        return audio, None
+
+    n_bytes = n_frames * audio.frame_width
+    raw_data = audio.to_bytes()
+    head, tail = [
+        AudioSample(
+            AudioSegment(data, sample_width=audio.sample_width, frame_rate=audio.frame_rate, channels=audio.n_channels)
+        )
+        for data in (raw_data[:n_bytes], raw_data[n_bytes:])
+    ]
+    return head, tail
+
+
+class BufferedAudioSource(BaseAudioSource):
+    """
+    Read from another audio source in a background thread, buffering the audio until it's read.
+
+    Reading from the wrapped source doesn't wait on whatever is consuming the audio (e.g. a listener deciding the state
+    of each frame), so a live source like a microphone keeps being read while the consumer is busy.
+    """
+
+    POLL_SECONDS = 0.1
+
+    def __init__(self, source: BaseAudioSource, chunk_seconds: TimeType = 0.25, max_buffered_seconds: TimeType = 10):
+        """
+        ``chunk_seconds`` is the amount of audio the background thread reads from ``source`` at a time.
+
+        ``max_buffered_seconds`` is the most audio to hold on to.  Once that much is buffered, the background thread
+        waits for some of it to be read before reading more from ``source``.
+        """
+        if chunk_seconds <= 0:
+            raise ValueError(f"`chunk_seconds` must be greater than zero, received {chunk_seconds!r}")
+
+        self.source = source
+        self._chunk_frames = max(1, source.seconds_to_frame(chunk_seconds))
+        self._chunks = queue.Queue(
+            maxsize=max(1, math.ceil(max_buffered_seconds / chunk_seconds))
+        )  # type: queue.Queue[AudioSample]
+        self._leftover = None  # type: Optional[AudioSample]
+        self._source_error = None  # type: Optional[Exception]
+
+        self._thread = None  # type: Optional[threading.Thread]
+        self._stop_reading = threading.Event()
+
+    @property
+    def frame_rate(self) -> int:
+        return self.source.frame_rate
+
+    def start(self) -> None:
+        """
+        Start reading from the source in a background thread.  ``read`` calls this automatically if the source hasn't
+        been started yet.
+        """
+        if self.is_reading:
+            raise SourceRunningError(f"{self} is already running")
+        self._stop_reading.clear()
+        self._source_error = None
+        self._thread = threading.Thread(target=self._read_in_background)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop reading from the source in the background.
+
+        ``timeout`` indicates how long to wait when joining the background thread.  If ``None`` (default), then don't
+        wait.
+
+        Returns ``True`` if the background thread has stopped, ``False`` otherwise (e.g. it's still waiting on a read
+        from the source).
+
+        Audio already buffered will still be available through the ``read`` method.
+        """
+        self._stop_reading.set()
+        if self._thread is None:
+            return True
+        if timeout is not None:
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def is_reading(self) -> bool:
+        """
+        Return whether the background thread is reading from the source.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def _read_in_background(self) -> None:
+        """
+        Read from the source until stopped or the source raises an exception (such as ``EOFError``), which will be
+        raised from ``read`` once the buffered audio has been read.
+        """
+        try:
+            while not self._stop_reading.is_set():
+                audio = self.source.read(self._chunk_frames)
+                while not self._stop_reading.is_set():
+                    try:
+                        self._chunks.put(audio, timeout=self.POLL_SECONDS)
+                        break
+                    except queue.Full:
+                        pass
+        except Exception as exc:  # pylint: disable=broad-except
+            self._source_error = exc
+
+    def _next_chunk(self) -> Optional[AudioSample]:
+        """
+        Return the next chunk of buffered audio, waiting for one if the background thread is still reading.  Returns
+        ``None`` if there's no more audio.
+        """
+        if self._leftover is not None:
+            audio, self._leftover = self._leftover, None
+            return audio
+
+        while True:
+            try:
+                return self._chunks.get(timeout=self.POLL_SECONDS)
+            except queue.Empty:
+                if not self.is_reading:
+                    break
+
+        # The thread may have put its last chunk between the timeout and checking whether it's still running
+        try:
+            return self._chunks.get_nowait()
+        except queue.Empty:
+            return None
+
+    def read(self, n_frames: Optional[int]) -> AudioSample:
+        """
+        Read ``n_frames`` of buffered audio, waiting for the background thread to read more from the source if needed.
+        If ``n_frames`` is ``None``, return the next chunk of audio read from the source.
+
+        Fewer frames are returned if the source ran out of audio.  Once all of the buffered audio has been read, the
+        exception that stopped the background thread is raised (``EOFError`` if it was stopped by calling ``stop``).
+        """
+        if n_frames is not None and n_frames <= 0:
+            raise ValueError(f"`n_frames` must be None or greater than zero, received {n_frames!r}")
+
+        if self._thread is None:
+            self.start()
+
+        chunks = []  # type: List[AudioSample]
+        n_frames_read = 0
+        while (n_frames is None and len(chunks) == 0) or (n_frames is not None and n_frames_read < n_frames):
+            audio = self._next_chunk()
+            if audio is None:
+                break
+            if n_frames is not None:
+                audio, self._leftover = _split_sample(audio, n_frames - n_frames_read)
+            chunks.append(audio)
+            n_frames_read += audio.n_frames
+
+        audio = AudioSample.from_iterable(chunks)
+        if audio is None:
+            if self._source_error is not None:
+                raise self._source_error
+            raise EOFError("The buffered audio source was stopped and all buffered audio has been read.")
+        return audio
@@ -1,20 +1,64 @@
-import io
-from typing import List, Mapping, Optional
+import atexit
+import functools
+from typing import List, Mapping, Optional, Tuple
 
 import pyaudio
 from pydub import AudioSegment
 
 from donkey_ears.audio.base import AudioSample, BaseAudioSource
 
+_PYAUDIO_INSTANCE = None  # type: Optional[pyaudio.PyAudio]
+
+
+def _get_pyaudio() -> pyaudio.PyAudio:
+    """
+    Return the PyAudio instance shared by every microphone, creating it on first use.
+    """
+    global _PYAUDIO_INSTANCE  # pylint: disable=global-statement
+    if _PYAUDIO_INSTANCE is None:
+        _PYAUDIO_INSTANCE = pyaudio.PyAudio()
+    return _PYAUDIO_INSTANCE
+
+
+def _terminate_pyaudio() -> None:
+    """
+    Terminate the shared PyAudio instance (if one was created) and forget any cached device information.
+    """
+    global _PYAUDIO_INSTANCE  # pylint: disable=global-statement
+    if _PYAUDIO_INSTANCE is not None:
+        _PYAUDIO_INSTANCE.terminate()
+        _PYAUDIO_INSTANCE = None
+    _get_device_information.cache_clear()
+    Microphone._device_names = None
+
+
+atexit.register(_terminate_pyaudio)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_device_information(device_index: Optional[int]) -> Mapping:
+    # The available devices rarely change while the program runs, so only ask PyAudio once per device
+    if device_index is None:
+        return _get_pyaudio().get_default_input_device_info()
+    return _get_pyaudio().get_device_info_by_index(device_index)
+
 
 class Microphone(BaseAudioSource):
+    _device_names = None  # type: Optional[List[str]]
+
     def __init__(self, device_index: Optional[int] = None):
         """
         The ``device_index`` is used to tell PyAudio which audio device to listen on.
+
+        A single PyAudio instance is shared by all microphones and terminated when the program exits.  The input stream
+        is opened on first use and kept open between reads.  Use ``close`` (or use the microphone as a context manager)
+        to release it.
         """
-        pa_instance = pyaudio.PyAudio()
-        device_count = pa_instance.get_device_count()
-        pa_instance.terminate()
+        self._stream = None  # type: Optional[pyaudio.Stream]
+        self._stream_parameters = None  # type: Optional[Tuple[Optional[int], int, int, int]]
+        self._audio_segment_parameters = None  # type: Optional[Mapping[str, int]]
+
+        device_count = self._pyaudio.get_device_count()
 
         if not (device_index is None or (isinstance(device_index, int) and 0 <= device_index < device_count)):
             raise ValueError(
@@ -24,15 +68,37 @@ class Microphone(BaseAudioSource):
         self._device_index = device_index
         self.DEFAULT_READ_DURATION_SECONDS = 5  # pylint: disable=invalid-name
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def _pyaudio(self) -> pyaudio.PyAudio:
+        return _get_pyaudio()
+
+    def close(self) -> None:
+        """
+        Close the input stream.  It will be reopened if the microphone is read from again.
+        """
+        if getattr(self, "_stream", None) is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+        self._stream = None
+        self._stream_parameters = None
+
     @classmethod
     def get_device_names(cls) -> List[str]:
-        pa_instance = pyaudio.PyAudio()
-        try:
-            return [
+        if cls._device_names is None:
+            pa_instance = _get_pyaudio()
+            cls._device_names = [
                 str(pa_instance.get_device_info_by_index(i).get("name")) for i in range(pa_instance.get_device_count())
             ]
-        finally:
-            pa_instance.terminate()
+        return list(cls._device_names)
 
     @property
     def device_index(self) -> Optional[int]:
@@ -40,14 +106,7 @@ class Microphone(BaseAudioSource):
 
     @property
     def audio_device_information(self) -> Mapping:
-        pa_instance = pyaudio.PyAudio()
-        try:
-            if self.device_index is None:
-                return pa_instance.get_default_input_device_info()
-
-            return pa_instance.get_device_info_by_index(self.device_index)
-        finally:
-            pa_instance.terminate()
+        return _get_device_information(self.device_index)
 
     @property
     def frame_rate(self) -> int:
@@ -73,6 +132,23 @@ class Microphone(BaseAudioSource):
     def DEFAULT_READ_DURATION_FRAMES(self) -> int:  # pylint: disable=invalid-name
         return self.seconds_to_frame(self.DEFAULT_READ_DURATION_SECONDS)
 
+    def _get_stream(self) -> pyaudio.Stream:
+        """
+        Return the open input stream, opening it if it isn't open or if the stream's parameters have changed.
+        """
+        parameters = (self.device_index, self.n_channels, self._pyaudio_format, self.frame_rate)
+        if self._stream is None or self._stream_parameters != parameters:
+            self.close()
+            self._stream = self._pyaudio.open(
+                input_device_index=self.device_index,
+                channels=self.n_channels,
+                format=self._pyaudio_format,
+                rate=self.frame_rate,
+                input=True,
+            )
+            self._stream_parameters = parameters
+        return self._stream
+
     def read_bytes(self, n_frames: int) -> bytes:
         if not isinstance(n_frames, int):
             raise TypeError(
@@ -81,30 +157,20 @@ class Microphone(BaseAudioSource):
         if n_frames == 0:
             raise ValueError(f"`n_frames` must be an integer greater than zero, received {n_frames!r}")
 
-        pa_instance = pyaudio.PyAudio()
-        try:
-            audio_source = pa_instance.open(
-                input_device_index=self.device_index,
-                channels=self.n_channels,
-                format=self._pyaudio_format,
-                rate=self.frame_rate,
-                input=True,
-            )
-            return audio_source.read(n_frames, exception_on_overflow=False)
-        finally:
-            pa_instance.terminate()
+        return self._get_stream().read(n_frames, exception_on_overflow=False)
 
     def read_pydub(self, n_frames: int) -> AudioSegment:
         """
         Read n_frames from the microphone and return a pydub.AudioSegment object.
         """
-        with io.BytesIO(self.read_bytes(n_frames)) as fp:
-            return AudioSegment.from_raw(
-                fp,
-                sample_width=self.frame_width,
-                frame_rate=self.frame_rate,
-                channels=self.n_channels,
-            )
+        if self._audio_segment_parameters is None:
+            # The microphone's audio format doesn't change, so only look it up on the first read
+            self._audio_segment_parameters = {
+                "sample_width": self.frame_width,
+                "frame_rate": self.frame_rate,
+                "channels": self.n_channels,
+            }
+        return AudioSegment(self.read_bytes(n_frames), **self._audio_segment_parameters)
 
     def read(self, n_frames: Optional[int]) -> AudioSample:
         if n_frames is None:
@@ -1,12 +1,11 @@
-import itertools
 import math
 import queue
 import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
 
+import numpy as np
 from loguru import logger
 
 from donkey_ears.audio.base import AudioSample, BaseAudioSource, TimeType
@@ -21,32 +20,46 @@ class ListenerRunningError(Exception):
 
 
 class Listener:
+    DEFAULT_READ_DURATION_SECONDS = 0.25
+
     def __init__(self, source: BaseAudioSource):
         self.source = source
 
-    def read(self, n_frames: int = 2**14) -> AudioSample:
+    def _n_frames_or_default(self, n_frames: Optional[int]) -> int:
+        """
+        Return ``n_frames``, or if it is ``None``, the number of frames in ``DEFAULT_READ_DURATION_SECONDS`` of audio
+        from the source.
+        """
+        if n_frames is None:
+            return self.source.seconds_to_frame(self.DEFAULT_READ_DURATION_SECONDS)
+        return n_frames
+
+    def read(self, n_frames: Optional[int] = None) -> AudioSample:
         """
         Read and return an audio sample from the source.
 
-        ``n_frames`` is the number of frames to read from the source.
+        ``n_frames`` is the number of frames to read from the source.  If ``None`` (default), read
+        ``DEFAULT_READ_DURATION_SECONDS`` of audio.
 
         Raises ``NoAudioAvailable`` if there is no audio available from the source (e.g. end of file was reached).
         """
         try:
-            return self.source.read(n_frames)
+            return self.source.read(self._n_frames_or_default(n_frames))
         except EOFError as exc:
             raise NoAudioAvailable() from exc
 
     def __iter__(self):
-        for _ in itertools.count():
+        while True:
             try:
                 yield self.read()
             except NoAudioAvailable:
                 return None
         return None
 
-    def continuous_listener(self) -> "ContinuousListener":
-        return ContinuousListener(self)
+    def continuous_listener(
+        self, max_recordings: Optional[int] = 256, overflow: str = "discard"
+    ) -> "ContinuousListener":
+        return ContinuousListener(self, max_recordings, overflow)
 
 
 class _EndOfListener:
@@ -59,13 +72,36 @@ class ContinuousListener:
     """
 
     END_OF_LISTENER = _EndOfListener()
+    OVERFLOW_POLICIES = ("discard", "evict", "block")
+    POLL_SECONDS = 0.1
+
+    def __init__(self, listener: Listener, max_recordings: Optional[int] = 256, overflow: str = "discard"):
+        """
+        ``max_recordings`` is the most recordings to hold on to until they're read (``None`` for no limit).  When that
+        many are waiting to be read, ``overflow`` determines what happens to a new recording:
+        * ``"discard"`` (default): drop the new recording.
+        * ``"evict"``: drop the oldest recording waiting to be read to make room for the new one.
+        * ``"block"``: stop listening until a recording is read, so the listener is paced by the reader.  A recording
+          waiting for room when the listener is stopped is dropped.
+
+        The number of recordings dropped is available in ``dropped_count``.
+        """
+        if max_recordings is not None and max_recordings < 1:
+            raise ValueError(f"`max_recordings` must be None or greater than zero, received {max_recordings!r}")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"`overflow` must be one of {self.OVERFLOW_POLICIES}, received {overflow!r}")
 
-    def __init__(self, listener: Listener):
         self.listener = listener
+        self.max_recordings = max_recordings
+        self.overflow = overflow
+        self.dropped_count = 0
 
         self._thread = None  # type: Optional[threading.Thread]
-        self._recordings = queue.SimpleQueue()  # type: queue.SimpleQueue[Union[AudioSample, _EndOfListener]]
-        self._please_shutdown_thread = False
+        # A Queue rather than a SimpleQueue, so that evicting a recording can skip over END_OF_LISTENER markers
+        self._recordings = queue.Queue()  # type: queue.Queue[Union[AudioSample, _EndOfListener]]
+        # Counts the room left for recordings; END_OF_LISTENER doesn't take up room so it can always be stored
+        self._open_slots = None if max_recordings is None else threading.Semaphore(max_recordings)
+        self._stop_listening = threading.Event()
 
     def start(self) -> None:
         """
@@ -76,7 +112,7 @@ class ContinuousListener:
             if self._thread.is_alive():
                 raise ListenerRunningError(f"{self} is already running")
             self.stop()
-        self._please_shutdown_thread = False
+        self._stop_listening.clear()
         self._thread = threading.Thread(target=self._listen)
         self._thread.daemon = True
         self._thread.start()
@@ -92,7 +128,7 @@ class ContinuousListener:
 
         Audio already recorded will still be available through the ``read`` method.
         """
-        self._please_shutdown_thread = True
+        self._stop_listening.set()
         if self._thread is not None:
             self._thread.join(timeout)
             return_value = timeout is None or not self._thread.is_alive()
@@ -121,9 +157,46 @@ class ContinuousListener:
         """
         return self.listener.read()
 
+    def _count_dropped_recording(self) -> None:
+        self.dropped_count += 1
+        if self.dropped_count == 1:
+            logger.warning(
+                f"{self} is holding {self.max_recordings} unread recordings, dropping recordings using the "
+                f"{self.overflow!r} policy"
+            )
+
     def _store_recording(self, audio: AudioSample) -> None:
+        if self._open_slots is not None and not self._open_slots.acquire(blocking=False):
+            if self.overflow == "block":
+                while not self._open_slots.acquire(timeout=self.POLL_SECONDS):
+                    if self._stop_listening.is_set():
+                        self._count_dropped_recording()
+                        return
+            elif self.overflow == "discard":
+                self._count_dropped_recording()
+                return
+            else:
+                self._evict_oldest_recording()
         self._recordings.put(audio)
 
+    def _evict_oldest_recording(self) -> None:
+        """
+        Remove the oldest unread recording and take over its slot.  ``END_OF_LISTENER`` markers don't take up a slot,
+        so they're left where they are.
+        """
+        with self._recordings.mutex:
+            # ``get`` can only take the item at the head, so remove the recording from the queue's deque directly
+            pending = self._recordings.queue
+            oldest_index = next((index for index, item in enumerate(pending) if item is not self.END_OF_LISTENER), None)
+            if oldest_index is not None:
+                del pending[oldest_index]
+
+        if oldest_index is None:
+            # The recordings were read in the meantime, so a slot is (about to be) released
+            self._open_slots.acquire()
+        else:
+            self._count_dropped_recording()
+
     def _store_recording_stopped(self) -> None:
         self._recordings.put(self.END_OF_LISTENER)
 
@@ -131,7 +204,7 @@ class ContinuousListener:
         """
         The method that does the actual listening and adding the audio to a queue.
         """
-        while not self._please_shutdown_thread and self.is_listening:
+        while not self._stop_listening.is_set() and self.is_listening:
             try:
                 audio = self._get_audio()
                 # logger.debug(f"Received audio: {audio}")
@@ -146,6 +219,17 @@ class ContinuousListener:
                 break
         self._store_recording_stopped()
 
+    @staticmethod
+    def _translate_wait(wait: Union[int, float, bool]) -> Tuple[bool, Optional[float]]:
+        """
+        Convert ``read``'s ``wait`` argument into the ``block`` and ``timeout`` arguments for getting from the queue.
+        """
+        if wait is True:
+            return True, None
+        if wait is False or wait == 0:
+            return False, None
+        return True, (wait if wait > 0 else None)
+
     def read(self, wait: Union[int, float, bool] = True) -> AudioSample:
         """
         Return the next audio sample recorded.
@@ -162,18 +246,19 @@ class ContinuousListener:
         if not self.is_listening and self._recordings.empty():
             raise NoAudioAvailable()
 
-        blocking = not (wait is False or wait == 0)
-        timeout = wait if isinstance(wait, (int, float)) and not isinstance(wait, bool) and wait > 0 else None
+        blocking, timeout = self._translate_wait(wait)
         try:
             result = self._recordings.get(blocking, timeout)
-            if isinstance(result, _EndOfListener):
+            if result is self.END_OF_LISTENER:
                 raise NoAudioAvailable()
+            if self._open_slots is not None:
+                self._open_slots.release()
             return result
         except queue.Empty as exc:
             raise NoAudioAvailable() from exc
 
     def __iter__(self):
-        for _ in itertools.count():
+        while True:
             try:
                 frame = self.read()
                 yield frame
@@ -200,8 +285,7 @@ class FrameStateEnum(Enum):
     STOP = "STOP"
 
 
-@dataclass
-class AnnotatedFrame:
+class AnnotatedFrame(NamedTuple):
     frame: AudioSample
     state: FrameStateEnum
 
@@ -229,10 +313,10 @@ class BaseStateListener(Listener):
         """
         return audio
 
-    def _listen_frames(self, n_frames: int) -> List[AnnotatedFrame]:
+    def _iter_frames(self, n_frames: int) -> Iterator[AnnotatedFrame]:
         """
-        Record and collect audio frames until the ``STOP`` frame state has been reached.  Return a list of all frames
-        recorded (including the ``STOP`` frame).
+        Record audio frames until the ``STOP`` frame state has been reached, yielding each frame (including the ``STOP``
+        frame) as soon as its state is known.
 
         If the end of the source is reached, then listening will end regardless of what ``_determine_frame_state`` will
         return.
@@ -244,8 +328,9 @@ class BaseStateListener(Listener):
         frame = self._pre_process_individual_audio_sample(frame)
         frame_state = self._determine_frame_state(frame, all_frames)
 
-        while frame_state != FrameStateEnum.STOP:
+        while frame_state is not FrameStateEnum.STOP:
             all_frames.append(AnnotatedFrame(frame, frame_state))
+            yield all_frames[-1]
             try:
                 frame = self.source.read(n_frames)
             except EOFError:
@@ -256,8 +341,25 @@ class BaseStateListener(Listener):
             frame_state = self._determine_frame_state(frame, all_frames)
 
         if frame is not None:
-            all_frames.append(AnnotatedFrame(frame, frame_state))
-        return all_frames
+            yield AnnotatedFrame(frame, frame_state)
+
+    def _listen_frames(self, n_frames: int) -> List[AnnotatedFrame]:
+        """
+        Record and collect audio frames until the ``STOP`` frame state has been reached.  Return a list of all frames
+        recorded (including the ``STOP`` frame).
+
+        If the end of the source is reached, then listening will end regardless of what ``_determine_frame_state`` will
+        return.
+        """
+        return list(self._iter_frames(n_frames))
+
+    @staticmethod
+    def _keep_frame(frame_state: FrameStateEnum, previous_state: FrameStateEnum) -> bool:
+        """
+        Return whether a frame is kept by ``_filter_audio_samples``: when its state is ``LISTEN`` or the previous
+        frame's state was ``LISTEN``.
+        """
+        return frame_state is FrameStateEnum.LISTEN or previous_state is FrameStateEnum.LISTEN
 
     def _filter_audio_samples(self, all_frames: List[AnnotatedFrame]) -> List[AnnotatedFrame]:
         """
@@ -266,13 +368,12 @@ class BaseStateListener(Listener):
         This method keeps all frames where the frame state was ``LISTEN`` or where the previous frame's state was
         ``LISTEN``.
         """
-        saved_frames = [
-            frame
-            for frame, previous_frame in zip(
-                all_frames, [AnnotatedFrame(AudioSample.generate_silence(0, 44100), FrameStateEnum.PAUSE)] + all_frames
-            )
-            if frame.state == FrameStateEnum.LISTEN or previous_frame.state == FrameStateEnum.LISTEN
-        ]
+        saved_frames = []
+        previous_state = FrameStateEnum.PAUSE
+        for frame in all_frames:
+            if self._keep_frame(frame.state, previous_state):
+                saved_frames.append(frame)
+            previous_state = frame.state
         return saved_frames
 
     def _join_audio_samples(self, all_frames: List[AnnotatedFrame]) -> AudioSample:
@@ -291,21 +392,59 @@ class BaseStateListener(Listener):
         """
         return audio
 
-    def read(self, n_frames: int = 2**14) -> AudioSample:
+    def _prepare_to_listen(self, n_frames: Optional[int]) -> int:
+        """
+        Called at the start of ``read`` and ``stream`` with the ``n_frames`` they were given.  Return the number of
+        frames to read from the source on each call.
+        """
+        return self._n_frames_or_default(n_frames)
+
+    def read(self, n_frames: Optional[int] = None) -> AudioSample:
         """
         Read and return an audio sample from the source.
 
         This may make multiple calls to the source's ``read`` method so that enough audio is collected to return.
 
-        ``n_frames`` is the number of frames to read from the source on each call.
+        ``n_frames`` is the number of frames to read from the source on each call.  If ``None`` (default), read
+        ``DEFAULT_READ_DURATION_SECONDS`` of audio on each call.
         """
-        all_frames = self._listen_frames(n_frames)
+        all_frames = self._listen_frames(self._prepare_to_listen(n_frames))
         all_frames = self._filter_audio_samples(all_frames)
         audio_sample = self._join_audio_samples(all_frames)
         audio_sample = self._post_process_final_audio_sample(audio_sample)
 
         return audio_sample
 
+    def stream(self, n_frames: Optional[int] = None) -> Iterator[AudioSample]:
+        """
+        Like ``read``, but yield the audio as it's heard instead of waiting until listening stops.  Joining the audio
+        yielded gives the same audio sample ``read`` would have returned.
+
+        If ``read``, ``_listen_frames``, ``_filter_audio_samples``, ``_join_audio_samples``, or
+        ``_post_process_final_audio_sample`` have been overridden, then streaming would bypass them, so a single sample
+        from ``read`` is yielded instead.
+        """
+        if (
+            type(self).read is not BaseStateListener.read
+            or type(self)._listen_frames is not BaseStateListener._listen_frames
+            or type(self)._filter_audio_samples is not BaseStateListener._filter_audio_samples
+            or type(self)._join_audio_samples is not BaseStateListener._join_audio_samples
+            or type(self)._post_process_final_audio_sample is not BaseStateListener._post_process_final_audio_sample
+        ):
+            yield self.read(n_frames)
+            return
+
+        heard_audio = False
+        previous_state = FrameStateEnum.PAUSE
+        for frame in self._iter_frames(self._prepare_to_listen(n_frames)):
+            if self._keep_frame(frame.state, previous_state):
+                heard_audio = True
+                yield frame.frame
+            previous_state = frame.state
+
+        if not heard_audio:
+            yield AudioSample.generate_silence(0, self.source.frame_rate)
+
 
 class SilenceBasedListener(BaseStateListener):
     """
@@ -319,15 +458,89 @@ class SilenceBasedListener(BaseStateListener):
         super().__init__(source)
         self.silence_threshold_rms = silence_threshold_rms
 
+    @property
+    def silence_threshold_rms(self) -> int:
+        return self._silence_threshold_rms
+
+    @silence_threshold_rms.setter
+    def silence_threshold_rms(self, silence_threshold_rms: int) -> None:
+        self._silence_threshold_rms = silence_threshold_rms
+        self._silence_threshold_rms_squared = silence_threshold_rms * silence_threshold_rms
+
     def _determine_frame_state(self, latest_frame: AudioSample, all_frames: List[AnnotatedFrame]) -> FrameStateEnum:
-        if latest_frame.rms > self.silence_threshold_rms:
+        # Same as ``latest_frame.rms_exceeds(self.silence_threshold_rms)``, but with the threshold already squared
+        if latest_frame.sum_of_squares > self._silence_threshold_rms_squared * latest_frame.n_samples:
             return FrameStateEnum.LISTEN
-        if len(all_frames) == 0 or all_frames[-1].state == FrameStateEnum.PAUSE:
+        if len(all_frames) == 0 or all_frames[-1].state is FrameStateEnum.PAUSE:
             # Haven't started listening yet
             return FrameStateEnum.PAUSE
         return FrameStateEnum.STOP
 
 
+class AdaptiveSilenceListener(SilenceBasedListener):
+    """
+    A ``SilenceBasedListener`` that adjusts its silence threshold to the background noise.
+
+    The rms of the most recent frames is collected into a histogram.  The first two peaks of the histogram are taken to
+    be the typical rms of silence (``M1``) and of speech (``M2``), and the threshold is set to
+    ``(weight * M1 + M2) / (weight + 1)``.  Until the histogram has two peaks, ``silence_threshold_rms`` is used.
+    """
+
+    def __init__(
+        self,
+        source: BaseAudioSource,
+        silence_threshold_rms: int = 500,
+        *,
+        weight: float = 5,
+        history_size: int = 256,
+        update_interval: int = 16,
+        n_bins: int = 32,
+    ):
+        """
+        ``weight`` controls how close the threshold is to the silence peak; the larger it is, the closer the threshold
+        is to the rms of silence.
+
+        ``history_size`` is the number of recent frames whose rms is used to build the histogram.
+
+        ``update_interval`` is how many frames to read between updates of the threshold.
+
+        ``n_bins`` is the number of bins in the histogram.
+        """
+        super().__init__(source, silence_threshold_rms)
+        self.weight = weight
+        self.update_interval = update_interval
+        self.n_bins = n_bins
+        self._rms_history = np.zeros(history_size)
+        self._n_rms_recorded = 0
+
+    def _record_rms(self, rms: int) -> None:
+        self._rms_history[self._n_rms_recorded % self._rms_history.size] = rms
+        self._n_rms_recorded += 1
+        if self._n_rms_recorded % self.update_interval == 0:
+            self._update_threshold()
+
+    def _update_threshold(self) -> None:
+        """
+        Set the silence threshold from the histogram of recent rms values, leaving it unchanged if there aren't two
+        peaks in the histogram.
+        """
+        counts, bin_edges = np.histogram(self._rms_history[: self._n_rms_recorded], bins=self.n_bins)
+        bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+
+        # A peak is a bin with more values than its neighbors (the first bin of a plateau counts as the peak)
+        padded_counts = np.concatenate(([0], counts, [0]))
+        peaks = np.flatnonzero((counts > padded_counts[:-2]) & (counts >= padded_counts[2:]))
+        if len(peaks) < 2:
+            return
+
+        silence_rms, speech_rms = bin_centers[peaks[0]], bin_centers[peaks[1]]
+        self.silence_threshold_rms = int((self.weight * silence_rms + speech_rms) / (self.weight + 1))
+
+    def _determine_frame_state(self, latest_frame: AudioSample, all_frames: List[AnnotatedFrame]) -> FrameStateEnum:
+        self._record_rms(latest_frame.rms)
+        return super()._determine_frame_state(latest_frame, all_frames)
+
+
 class TimeBasedListener(BaseStateListener):
     """
     Listen to the audio source and return an audio sample that is ``total_duration`` seconds long.
@@ -336,21 +549,48 @@ class TimeBasedListener(BaseStateListener):
     def __init__(self, source: BaseAudioSource, total_duration: TimeType):
         super().__init__(source)
         self.total_duration = total_duration
+        self._accumulated_seconds = 0.0
+        self._n_accumulated_frames = 0
+
+    @property
+    def total_duration(self) -> TimeType:
+        return self._total_duration
+
+    @total_duration.setter
+    def total_duration(self, total_duration: TimeType) -> None:
+        self._total_duration = total_duration
+        self._total_duration_seconds = float(total_duration)
+
+    def _reset_accumulated_duration(self) -> None:
+        self._accumulated_seconds = 0.0
+        self._n_accumulated_frames = 0
+
+    def _accumulated_duration(self, all_frames: List[AnnotatedFrame]) -> float:
+        """
+        Return the total duration (in seconds) of ``all_frames``.  A running total is kept between calls, so only the
+        frames added since the previous call are summed.
+        """
+        if len(all_frames) < self._n_accumulated_frames:
+            self._reset_accumulated_duration()
+        for frame in all_frames[self._n_accumulated_frames :]:
+            self._accumulated_seconds += frame.frame.n_seconds
+        self._n_accumulated_frames = len(all_frames)
+        return self._accumulated_seconds
 
     def _determine_frame_state(self, latest_frame: AudioSample, all_frames: List[AnnotatedFrame]) -> FrameStateEnum:
-        duration = sum(frame.frame.n_seconds for frame in all_frames) + latest_frame.n_seconds
         if len(latest_frame) == 0:
             return FrameStateEnum.PAUSE
-        if duration <= self.total_duration or len(all_frames) == 0:
+        duration = self._accumulated_duration(all_frames) + latest_frame.n_seconds
+        if duration <= self._total_duration_seconds or len(all_frames) == 0:
             return FrameStateEnum.LISTEN
         return FrameStateEnum.STOP
 
-    def read(self, n_frames: int = 2**14) -> AudioSample:
+    def _prepare_to_listen(self, n_frames: Optional[int]) -> int:
         """
-        Read samples from the source until the total duration is reached.  ``n_frames`` is the suggested size for each
-        sample.  The number will be adjusted so that an integer number of samples is required to get the total duration.
+        ``n_frames`` is the suggested size for each sample (``DEFAULT_READ_DURATION_SECONDS`` of audio if ``None``).  The
+        number will be adjusted so that an integer number of samples is required to get the total duration.
         """
         total_duration_frames = self.total_duration * self.source.frame_rate
-        n_recordings = round(total_duration_frames / n_frames)
-        adjusted_n_frames = math.ceil(total_duration_frames / n_recordings)
-        return super().read(adjusted_n_frames)
+        n_recordings = max(1, round(total_duration_frames / self._n_frames_or_default(n_frames)))
+        self._reset_accumulated_duration()
+        return math.ceil(total_duration_frames / n_recordings)
@@ -1,7 +1,6 @@
-import itertools
 from typing import Union
 
-from donkey_ears.listeners.audio import ContinuousListener, Listener, NoAudioAvailable
+from donkey_ears.listeners.audio import BaseStateListener, ContinuousListener, Listener, NoAudioAvailable
 from donkey_ears.speech_to_text.base import BaseSpeechToText, DetailedTranscripts
 
 
@@ -11,17 +10,26 @@ class Transcriber:
         self.speech_to_text = speech_to_text
 
     def read(self) -> str:
+        if isinstance(self.listener, BaseStateListener):
+            # Transcribe the audio as it's heard instead of waiting for the listener to finish
+            return self.speech_to_text.transcribe_audio_stream(self.listener.stream())
+
         sample = self.listener.read()
         return self.speech_to_text.transcribe_audio(sample)
 
     def read_detailed(self, *, n_transcriptions: int = 3, segment_timestamps: bool = True) -> DetailedTranscripts:
+        if isinstance(self.listener, BaseStateListener):
+            return self.speech_to_text.transcribe_audio_stream_detailed(
+                self.listener.stream(), n_transcriptions=n_transcriptions, segment_timestamps=segment_timestamps
+            )
+
         sample = self.listener.read()
         return self.speech_to_text.transcribe_audio_detailed(
             sample, n_transcriptions=n_transcriptions, segment_timestamps=segment_timestamps
         )
 
     def __iter__(self):
-        for _ in itertools.count():
+        while True:
             try:
                 yield self.read()
             except NoAudioAvailable:
@@ -29,7 +37,7 @@ class Transcriber:
         return None
 
     def iter_detailed(self, *, n_transcriptions: int = 3, segment_timestamps: bool = True):
-        for _ in itertools.count():
+        while True:
             try:
                 yield self.read_detailed(n_transcriptions=n_transcriptions, segment_timestamps=segment_timestamps)
             except NoAudioAvailable:
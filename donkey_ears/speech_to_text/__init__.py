@@ -1,19 +1,22 @@
-try:
-    from donkey_ears.speech_to_text.coqui_stt import CoquiSpeechToText
-except ModuleNotFoundError:
-    pass
+import importlib
 
-try:
-    from donkey_ears.speech_to_text.sphinx import SphinxSpeechToText
-except ModuleNotFoundError:
-    pass
+# The engines pull in large libraries (e.g. torch for whisper), so only import an engine's module when its class is
+# first accessed (PEP 562).  Engines whose dependencies aren't installed are not available, as before.
+_LAZY_ENGINES = {
+    "CoquiSpeechToText": "donkey_ears.speech_to_text.coqui_stt",
+    "SphinxSpeechToText": "donkey_ears.speech_to_text.sphinx",
+    "VoskSpeechToText": "donkey_ears.speech_to_text.vosk",
+    "WhisperSpeechToText": "donkey_ears.speech_to_text.whisper",
+}
 
-try:
-    from donkey_ears.speech_to_text.vosk import VoskSpeechToText
-except ModuleNotFoundError:
-    pass
 
-try:
-    from donkey_ears.speech_to_text.whisper import WhisperSpeechToText
-except ModuleNotFoundError:
-    pass
+def __getattr__(name):
+    if name in _LAZY_ENGINES:
+        try:
+            module = importlib.import_module(_LAZY_ENGINES[name])
+        except ModuleNotFoundError as exc:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({exc})") from exc
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
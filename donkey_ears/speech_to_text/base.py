@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 from donkey_ears.audio.base import AudioSample
 
@@ -45,6 +45,12 @@ class BaseSpeechToText:
     def __init__(self):
         pass
 
+    def warm_up(self) -> None:
+        """
+        Run the engine once on a short silent sample so that any lazy initialization happens now instead of during the
+        first real transcription.  By default, this does nothing.
+        """
+
     def transcribe_audio_detailed(
         self, audio: AudioSample, *, n_transcriptions: int = 3, segment_timestamps: bool = True
     ) -> DetailedTranscripts:
@@ -52,3 +58,40 @@ class BaseSpeechToText:
 
     def transcribe_audio(self, audio: AudioSample) -> str:
         return self.transcribe_audio_detailed(audio, n_transcriptions=1).best_transcript.text
+
+    def transcribe_audio_stream_detailed(
+        self, audio_stream: Iterable[AudioSample], *, n_transcriptions: int = 3, segment_timestamps: bool = True
+    ) -> DetailedTranscripts:
+        """
+        Transcribe audio that arrives in pieces (e.g. from ``BaseStateListener.stream``).
+
+        By default, wait for all of the pieces, then transcribe them together with ``transcribe_audio_detailed``.
+        Engines that can transcribe incrementally override this to start transcribing before the last piece arrives.
+        """
+        return self.transcribe_audio_detailed(
+            self._join_audio_stream(audio_stream),
+            n_transcriptions=n_transcriptions,
+            segment_timestamps=segment_timestamps,
+        )
+
+    def transcribe_audio_stream(self, audio_stream: Iterable[AudioSample]) -> str:
+        """
+        Like ``transcribe_audio_stream_detailed``, but only return the text of the best transcript.
+
+        If ``transcribe_audio`` has been overridden, then the pieces are joined and given to it instead, so the
+        override isn't bypassed.
+        """
+        if type(self).transcribe_audio is not BaseSpeechToText.transcribe_audio:
+            return self.transcribe_audio(self._join_audio_stream(audio_stream))
+        return self.transcribe_audio_stream_detailed(audio_stream, n_transcriptions=1).best_transcript.text
+
+    @staticmethod
+    def _join_audio_stream(audio_stream: Iterable[AudioSample]) -> AudioSample:
+        """
+        Join the pieces of ``audio_stream`` into one audio sample.  Raises ``NoTranscriptionError`` if there are no
+        pieces.
+        """
+        audio = AudioSample.from_iterable(audio_stream)
+        if audio is None:
+            raise NoTranscriptionError("No audio was given to transcribe")
+        return audio
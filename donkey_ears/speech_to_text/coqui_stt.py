@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from stt import Model
 from stt.impl import CandidateTranscript
 
@@ -42,6 +43,12 @@ class CoquiSpeechToText(BaseSpeechToText):
     def frame_rate(self) -> int:
         return self._model.sampleRate()
 
+    def warm_up(self) -> None:
+        """
+        Transcribe a tenth of a second of silence, so the first real transcription doesn't pay for setting up the model.
+        """
+        self._model.sttWithMetadata(np.zeros(self.frame_rate // 10, dtype=np.int16), 1)
+
     def transcribe_audio_detailed(
         self, audio: AudioSample, *, n_transcriptions: int = 3, segment_timestamps: bool = True
     ) -> DetailedTranscripts:
@@ -66,29 +73,30 @@ class CoquiSpeechToText(BaseSpeechToText):
     def _coqui_token_metadata_to_detailed_transcript(
         transcript: CandidateTranscript, segment_timestamps: bool
     ) -> DetailedTranscript:
-        transcript_segments = []
-        word = []
+        tokens = transcript.tokens
+        last_index = len(tokens) - 1
+        words = []  # type: List[str]
+        transcript_segments = []  # type: List[TranscriptSegment]
+        word = []  # type: List[str]
         start_time = None
-        for i, token in enumerate(transcript.tokens):
-            if not token.text.isspace():
+        for i, token in enumerate(tokens):
+            is_space = token.text.isspace()
+            if not is_space:
                 word.append(token.text)
 
             if start_time is None:
                 start_time = token.start_time
 
-            if token.text.isspace() or i == len(transcript.tokens) - 1:
-                transcript_segments.append(
-                    TranscriptSegment(
-                        "".join(word),
-                        start_time,
-                        token.start_time,
-                    )
-                )
+            if is_space or i == last_index:
+                words.append("".join(word))
+                # Only build the segments if they're going to be returned
+                if segment_timestamps:
+                    transcript_segments.append(TranscriptSegment(words[-1], start_time, token.start_time))
                 word = []
                 start_time = None
 
         return DetailedTranscript(
-            " ".join(segment.text for segment in transcript_segments),
+            " ".join(words),
             transcript.confidence,
             transcript_segments if segment_timestamps else None,
         )
@@ -1,11 +1,36 @@
 import json
+import weakref
 from pathlib import Path
-from typing import Iterable, Union
+from typing import Iterable, Iterator, Union
 
 from vosk import KaldiRecognizer, Model
 
 from donkey_ears.audio.base import AudioSample
-from donkey_ears.speech_to_text.base import BaseSpeechToText, DetailedTranscript, DetailedTranscripts, TranscriptSegment
+from donkey_ears.speech_to_text.base import (
+    BaseSpeechToText,
+    DetailedTranscript,
+    DetailedTranscripts,
+    NoTranscriptionError,
+    TranscriptSegment,
+)
+
+try:
+    # orjson parses Vosk's (potentially large, when word timestamps are requested) results several times faster
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
+# Models are large and can be shared by any number of recognizers, so only load each model once while it's in use
+_MODEL_CACHE = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary[str, Model]
+
+
+def _load_model(model_path: Union[str, Path]) -> Model:
+    key = str(model_path)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = Model(model_path)
+        _MODEL_CACHE[key] = model
+    return model
 
 
 class VoskSpeechToText(BaseSpeechToText):
@@ -38,13 +63,13 @@ class VoskSpeechToText(BaseSpeechToText):
     @model_path.setter
     def model_path(self, model_path: Union[str, Path]):
         self._model_path = model_path
-        self._model = Model(self.model_path)
+        self._model = _load_model(self.model_path)
         self._recognizer = KaldiRecognizer(self._model, self.frame_rate)
 
     def copy(self) -> "VoskSpeechToText":
         """
         Return a copy of the object.  Changes to the original will not affect the copy, nor will changes to the copy
-        affect the original.
+        affect the original.  The copy has its own recognizer, but shares the (read-only) model with the original.
         """
         return VoskSpeechToText(self.model_path, self.frame_rate, self.bit_depth, self.n_channels)
 
@@ -52,6 +77,13 @@ class VoskSpeechToText(BaseSpeechToText):
     def sample_width(self) -> int:
         return self.bit_depth // 8
 
+    def warm_up(self) -> None:
+        """
+        Decode a tenth of a second of silence, so the first real transcription doesn't pay for setting up the decoder.
+        """
+        self._recognizer.AcceptWaveform(b"\x00" * (self.frame_rate // 10 * self.sample_width * self.n_channels))
+        self._recognizer.Reset()
+
     def transcribe_audio_detailed(
         self,
         audio: AudioSample,
@@ -67,16 +99,63 @@ class VoskSpeechToText(BaseSpeechToText):
 
         ``segment_timestamps``, if True, will provide start and end timestamps for each word in the transcript.
         """
+        return self._decode(iter([audio]), n_transcriptions, segment_timestamps)
+
+    def transcribe_audio_stream_detailed(
+        self,
+        audio_stream: Iterable[AudioSample],
+        *,
+        n_transcriptions: int = 3,
+        segment_timestamps: bool = True,
+    ) -> DetailedTranscripts:
+        """
+        Transcribe audio that arrives in pieces.  Each piece is given to Vosk as soon as it arrives, so decoding
+        overlaps with recording the rest of the audio.
+
+        If the audio needs resampling to ``frame_rate``, or ``transcribe_audio_detailed`` has been overridden, then the
+        pieces are joined and transcribed together instead.
+
+        ``n_transcriptions`` and ``segment_timestamps`` are the same as for ``transcribe_audio_detailed``.
+        """
+        if type(self).transcribe_audio_detailed is not VoskSpeechToText.transcribe_audio_detailed:
+            return super().transcribe_audio_stream_detailed(
+                audio_stream, n_transcriptions=n_transcriptions, segment_timestamps=segment_timestamps
+            )
+        return self._decode(iter(audio_stream), n_transcriptions, segment_timestamps)
+
+    def _decode(
+        self, audio_stream: Iterator[AudioSample], n_transcriptions: int, segment_timestamps: bool
+    ) -> DetailedTranscripts:
+        """
+        Give each piece of ``audio_stream`` to the recognizer and return its final result.  Raises
+        ``NoTranscriptionError`` if there are no pieces.
+        """
         self._recognizer.SetMaxAlternatives(n_transcriptions)
         self._recognizer.SetWords(segment_timestamps)
-        self._recognizer.AcceptWaveform(
-            audio.convert(
-                sample_width=self.sample_width,
-                frame_rate=self.frame_rate,
-                n_channels=self.n_channels,
-            ).to_bytes()
-        )
-        result = json.loads(self._recognizer.FinalResult())
+        heard_audio = False
+        try:
+            for audio in audio_stream:
+                heard_audio = True
+                if audio.frame_rate != self.frame_rate:
+                    # Resampling each piece on its own would restart the resampler at every piece boundary, putting
+                    # discontinuities in the audio, so resample the rest of the audio in one go
+                    remaining_audio = list(audio_stream)
+                    if remaining_audio:
+                        audio = AudioSample.from_iterable([audio, *remaining_audio])
+                self._recognizer.AcceptWaveform(
+                    audio.convert(
+                        sample_width=self.sample_width,
+                        frame_rate=self.frame_rate,
+                        n_channels=self.n_channels,
+                    ).to_bytes()
+                )
+        except BaseException:
+            # Don't let the audio already accepted leak into the next transcription
+            self._recognizer.Reset()
+            raise
+        if not heard_audio:
+            raise NoTranscriptionError("No audio was given to transcribe")
+        result = json_loads(self._recognizer.FinalResult())
 
         return DetailedTranscripts(
             [
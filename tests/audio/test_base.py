@@ -99,6 +99,90 @@ class TestAudioSample:  # pylint: disable=too-few-public-methods
 
         assert len(subject) == 5_000
 
+    @pytest.mark.parametrize("dtype", ["int8", "int16", "int32"])
+    def test_rms_matches_pydub_rms(self, dtype):
+        numpy_sample = (np.iinfo(dtype).max * np.sin(np.linspace(0, 40, 5_000))).astype(dtype)
+        subject = base.AudioSample.from_numpy(numpy_sample, 44100)
+
+        assert subject.rms == subject.data.rms
+
+    @pytest.mark.parametrize("dtype", ["int8", "int16", "int32"])
+    def test_sum_of_squares(self, dtype):
+        numpy_sample = (np.iinfo(dtype).max * np.sin(np.linspace(0, 40, 5_000))).astype(dtype)
+        subject = base.AudioSample.from_numpy(numpy_sample, 44100)
+
+        assert subject.sum_of_squares == pytest.approx(sum(int(value) ** 2 for value in numpy_sample))
+
+    @pytest.mark.parametrize("threshold, expected", [(199, True), (200, False), (201, False)])
+    def test_rms_exceeds(self, threshold, expected):
+        subject = base.AudioSample.from_numpy(np.full(1_000, 200, dtype="int16"), 44100)
+
+        assert subject.rms_exceeds(threshold) is expected
+
+    def test_rms_of_empty_sample_is_zero(self):
+        subject = base.AudioSample.generate_silence(0, 44100)
+
+        assert subject.rms == 0
+
+    def test_computed_values_are_cached(self):
+        subject = base.AudioSample.from_numpy(np.full(1_000, 200, dtype="int16"), 44100)
+
+        with mock.patch.object(base.AudioSample, "to_numpy", wraps=subject.to_numpy) as mock_to_numpy:
+            assert subject.rms == 200
+            assert subject.rms == 200
+            assert subject.rms_exceeds(100)
+
+        mock_to_numpy.assert_called_once_with()
+
+    def test_replacing_data_clears_cached_values(self):
+        subject = base.AudioSample.from_numpy(np.full(1_000, 200, dtype="int16"), 44100)
+        assert subject.rms == 200
+        assert subject.n_frames == 1_000
+
+        subject.data = base.AudioSample.from_numpy(np.full(500, 100, dtype="int16"), 44100).data
+
+        assert subject.rms == 100
+        assert subject.n_frames == 500
+        assert subject.n_seconds == 500 / 44100
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"frame_rate": 44100}, {"frame_rate": 44100, "sample_width": 2, "n_channels": 1}]
+    )
+    def test_converting_to_same_format_returns_same_sample(self, kwargs):
+        subject = base.AudioSample.from_numpy((10_000 * np.sin(np.linspace(0, 4, 5_000))).astype("int16"), 44100)
+
+        assert subject.convert(**kwargs) is subject
+
+    def test_converting_to_different_format(self):
+        subject = base.AudioSample.from_numpy((10_000 * np.sin(np.linspace(0, 4, 5_000))).astype("int16"), 44100)
+
+        actual = subject.convert(frame_rate=16000, sample_width=4, n_channels=2)
+
+        assert (actual.frame_rate, actual.sample_width, actual.n_channels) == (16000, 4, 2)
+
+    def test_from_iterable_concatenates_samples(self):
+        numpy_sample = (10_000 * np.sin(np.linspace(0, 4, 5_000))).astype("int16")
+        samples = [
+            base.AudioSample.from_numpy(numpy_sample[:1_000], 44100),
+            base.AudioSample.from_numpy(numpy_sample[1_000:3_500], 44100),
+            base.AudioSample.from_numpy(numpy_sample[3_500:], 44100),
+        ]
+
+        actual = base.AudioSample.from_iterable(samples)
+
+        assert actual == base.AudioSample.from_numpy(numpy_sample, 44100)
+
+    def test_from_iterable_matches_appending_samples_with_different_formats(self):
+        first_sample = base.AudioSample.from_numpy((10_000 * np.sin(np.linspace(0, 4, 800))).astype("int16"), 8000)
+        second_sample = base.AudioSample.from_numpy((10_000 * np.sin(np.linspace(0, 4, 1600))).astype("int16"), 16000)
+
+        actual = base.AudioSample.from_iterable([first_sample, second_sample])
+
+        assert actual == first_sample.append(second_sample)
+
+    def test_from_iterable_with_no_samples_returns_none(self):
+        assert base.AudioSample.from_iterable([]) is None
+
 
 class TestBaseAudioSource:  # pylint: disable=too-few-public-methods
     @pytest.mark.parametrize("seconds", [7, 11.12])
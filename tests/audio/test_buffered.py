@@ -0,0 +1,129 @@
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from donkey_ears.audio.audio_file import AudioFile
+from donkey_ears.audio.base import AudioSample
+from donkey_ears.audio.buffered import BufferedAudioSource
+
+ANY_AUDIO_FILE = Path(__file__).parent.parent / "resources" / "english-one_two_three.wav"
+
+
+def test_reading_all_frames_matches_source():
+    expected_audio = AudioFile(ANY_AUDIO_FILE).read(None)
+    subject = BufferedAudioSource(AudioFile(ANY_AUDIO_FILE), chunk_seconds=0.1)
+
+    actual_samples = []
+    while True:
+        try:
+            actual_samples.append(subject.read(10_000))
+        except EOFError:
+            break
+
+    assert [sample.n_frames for sample in actual_samples[:-1]] == [10_000] * (len(actual_samples) - 1)
+    assert AudioSample.from_iterable(actual_samples) == expected_audio
+
+
+def test_read_returns_frames_across_chunks():
+    source = MagicMock()
+    source.seconds_to_frame = MagicMock(return_value=4)
+    source.read = MagicMock(
+        side_effect=[
+            AudioSample.from_numpy(np.arange(0, 4, dtype="int16"), 16),
+            AudioSample.from_numpy(np.arange(4, 8, dtype="int16"), 16),
+            AudioSample.from_numpy(np.arange(8, 10, dtype="int16"), 16),
+            EOFError,
+        ]
+    )
+    subject = BufferedAudioSource(source, chunk_seconds=0.25)
+
+    actual = [subject.read(3).to_numpy().tolist() for _ in range(4)]
+
+    assert actual == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    source.read.assert_called_with(4)
+    with pytest.raises(EOFError):
+        subject.read(3)
+
+
+def test_read_with_no_frame_count_returns_next_chunk():
+    source = MagicMock()
+    source.seconds_to_frame = MagicMock(return_value=4)
+    source.read = MagicMock(side_effect=[AudioSample.from_numpy(np.arange(0, 4, dtype="int16"), 16), EOFError])
+    subject = BufferedAudioSource(source)
+
+    actual = subject.read(None)
+
+    assert actual.to_numpy().tolist() == [0, 1, 2, 3]
+
+
+def test_source_exception_raised_after_buffered_audio_is_read():
+    source = MagicMock()
+    source.seconds_to_frame = MagicMock(return_value=4)
+    source.read = MagicMock(side_effect=[AudioSample.from_numpy(np.arange(0, 4, dtype="int16"), 16), OSError])
+    subject = BufferedAudioSource(source)
+
+    actual = subject.read(4)
+
+    assert actual.to_numpy().tolist() == [0, 1, 2, 3]
+    with pytest.raises(OSError):
+        subject.read(4)
+
+
+def test_read_after_stop_raises_eoferror():
+    source = MagicMock()
+    source.seconds_to_frame = MagicMock(return_value=4)
+    source.read = MagicMock(return_value=AudioSample.from_numpy(np.arange(0, 4, dtype="int16"), 16))
+    subject = BufferedAudioSource(source, chunk_seconds=1, max_buffered_seconds=1)
+
+    with subject:
+        pass
+    subject.stop(timeout=5)
+    while True:
+        try:
+            subject.read(4)
+        except EOFError:
+            break
+
+    assert subject.is_reading is False
+
+
+def test_stop_without_timeout_does_not_wait_for_blocked_source():
+    source_released = threading.Event()
+
+    def blocking_read(n_frames):  # pylint: disable=unused-argument
+        source_released.wait()
+        raise EOFError()
+
+    source = MagicMock()
+    source.seconds_to_frame = MagicMock(return_value=4)
+    source.read = MagicMock(side_effect=blocking_read)
+    subject = BufferedAudioSource(source)
+    subject.start()
+
+    stopped_without_waiting = subject.stop()
+    source_released.set()
+    stopped_after_waiting = subject.stop(timeout=5)
+
+    assert stopped_without_waiting is False
+    assert stopped_after_waiting is True
+
+
+def test_chunk_seconds_must_be_positive():
+    with pytest.raises(ValueError):
+        BufferedAudioSource(MagicMock(), chunk_seconds=0)
+
+
+@pytest.mark.parametrize("n_frames", [0, -1], ids=["zero", "negative"])
+def test_reading_no_frames_is_invalid(n_frames):
+    source = MagicMock()
+    source.seconds_to_frame = MagicMock(return_value=4)
+    source.read = MagicMock(return_value=AudioSample.from_numpy(np.arange(0, 4, dtype="int16"), 16))
+    subject = BufferedAudioSource(source)
+
+    with pytest.raises(ValueError):
+        subject.read(n_frames)
+
+    assert subject.is_reading is False
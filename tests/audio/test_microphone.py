@@ -1,51 +1,78 @@
-import io
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pyaudio
 import pytest
 from pydub import AudioSegment
 
+from donkey_ears.audio import microphone
 from donkey_ears.audio.base import AudioSample
 from donkey_ears.audio.microphone import Microphone
 
+SILENCE_FRAME_RATE = 16000
+SILENCE_SEGMENT = AudioSegment(b"\x00\x00", sample_width=2, frame_rate=SILENCE_FRAME_RATE, channels=1)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_pyaudio(monkeypatch):
+    monkeypatch.setattr(microphone, "_PYAUDIO_INSTANCE", None)
+    monkeypatch.setattr(Microphone, "_device_names", None)
+    microphone._get_device_information.cache_clear()
+    yield
+    microphone._terminate_pyaudio()
+    assert Microphone._device_names is None
+    assert microphone._get_device_information.cache_info().currsize == 0
+
+
+@pytest.fixture
+def microphone_reading_silence():
+    mock_pa_instance = MagicMock()
+    mock_pa_instance.get_default_input_device_info = MagicMock(return_value={"defaultSampleRate": SILENCE_FRAME_RATE})
+    with patch("donkey_ears.audio.microphone.pyaudio.PyAudio", MagicMock(return_value=mock_pa_instance)):
+        subject = Microphone()
+        subject.read_bytes = MagicMock(return_value=b"\x00\x00")
+        yield subject, mock_pa_instance
+
 
 class TestMicrophone:
     @staticmethod
-    def test_device_index_is_validated_against_available_devices():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_device_index_is_validated_against_available_devices(mock_pyaudio):
         # Arrange
         mock_pa_instance = MagicMock()
         mock_pa_instance.get_device_count = MagicMock(return_value=3)
         mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
+        mock_pyaudio.return_value = mock_pa_instance
 
         # Act
         Microphone(2)
 
         # Assert
         mock_pa_instance.get_device_count.assert_called_once_with()
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pyaudio.assert_called_once_with()
 
     @staticmethod
-    def test_device_index_out_of_range_is_invalid():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_device_index_out_of_range_is_invalid(mock_pyaudio):
         # Arrange
         mock_pa_instance = MagicMock()
         mock_pa_instance.get_device_count = MagicMock(return_value=3)
         mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
+        mock_pyaudio.return_value = mock_pa_instance
 
         # Act and Assert
         with pytest.raises(ValueError):
             Microphone(5)
 
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pyaudio.assert_called_once_with()
 
     @staticmethod
-    def test_default_device_used_when_device_index_is_none():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_default_device_used_when_device_index_is_none(mock_pyaudio):
         # Arrange
         mock_pa_instance = MagicMock()
         mock_pa_instance.get_default_input_device_info = MagicMock(return_value={"device": "information"})
         mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
+        mock_pyaudio.return_value = mock_pa_instance
         subject = Microphone()
 
         # Act
@@ -54,16 +81,17 @@ class TestMicrophone:
         # Assert
         assert actual_device_info == {"device": "information"}
         mock_pa_instance.get_default_input_device_info.assert_called_once_with()
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pyaudio.assert_called_once_with()
 
     @staticmethod
-    def test_device_used_when_device_index_is_given():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_device_used_when_device_index_is_given(mock_pyaudio):
         # Arrange
         mock_pa_instance = MagicMock()
         mock_pa_instance.get_device_info_by_index = MagicMock(return_value={"device": "information"})
         mock_pa_instance.get_device_count = MagicMock(return_value=5)
         mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
+        mock_pyaudio.return_value = mock_pa_instance
         subject = Microphone(3)
 
         # Act
@@ -72,27 +100,25 @@ class TestMicrophone:
         # Assert
         assert actual_device_info == {"device": "information"}
         mock_pa_instance.get_device_info_by_index.assert_called_once_with(3)
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pyaudio.assert_called_once_with()
 
     @staticmethod
-    def test_read_bytes():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_read_bytes(mock_pyaudio):
         # Arrange
         mock_input_source = MagicMock()
         mock_input_source.read = MagicMock(return_value=b"0")
         mock_pa_instance = MagicMock()
         mock_pa_instance.open = MagicMock(return_value=mock_input_source)
         mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
+        mock_pyaudio.return_value = mock_pa_instance
         subject = Microphone()
-        pyaudio.PyAudio.reset_mock()
-        mock_pa_instance.terminate.reset_mock()
 
         # Act
         bytes_read = subject.read_bytes(1)
 
         # Assert
-        pyaudio.PyAudio.assert_has_calls([call(), call()])
-        assert pyaudio.PyAudio.call_count == 2
+        mock_pyaudio.assert_called_once_with()
         mock_pa_instance.open.assert_called_once_with(
             input_device_index=None,
             channels=subject.n_channels,
@@ -100,85 +126,197 @@ class TestMicrophone:
             rate=subject.frame_rate,
             input=True,
         )
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pa_instance.terminate.assert_not_called()
         mock_input_source.read.assert_called_once_with(1, exception_on_overflow=False)
         assert bytes_read == b"0"
 
     @staticmethod
-    def test_read_pydub():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_repeated_reads_reuse_open_stream(mock_pyaudio):
+        # Arrange
+        mock_input_source = MagicMock()
+        mock_input_source.read = MagicMock(side_effect=[b"0", b"1"])
+        mock_pa_instance = MagicMock()
+        mock_pa_instance.open = MagicMock(return_value=mock_input_source)
+        mock_pyaudio.return_value = mock_pa_instance
+        subject = Microphone()
+
+        # Act
+        first_bytes_read = subject.read_bytes(1)
+        second_bytes_read = subject.read_bytes(1)
+
+        # Assert
+        mock_pyaudio.assert_called_once_with()
+        mock_pa_instance.open.assert_called_once()
+        mock_input_source.close.assert_not_called()
+        assert first_bytes_read == b"0"
+        assert second_bytes_read == b"1"
+
+    @staticmethod
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_microphones_share_pyaudio_instance(mock_pyaudio):
         # Arrange
         mock_pa_instance = MagicMock()
+        mock_pa_instance.get_device_count = MagicMock(return_value=3)
+        mock_pyaudio.return_value = mock_pa_instance
+
+        # Act
+        Microphone(1)
+        Microphone(2)
+        Microphone.get_device_names()
+
+        # Assert
+        mock_pyaudio.assert_called_once_with()
+        mock_pa_instance.terminate.assert_not_called()
+
+    @staticmethod
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_device_information_is_cached(mock_pyaudio):
+        # Arrange
+        mock_pa_instance = MagicMock()
+        mock_pa_instance.get_default_input_device_info = MagicMock(return_value={"defaultSampleRate": 16000.0})
+        mock_pyaudio.return_value = mock_pa_instance
+        subject = Microphone()
+
+        # Act
+        first_frame_rate = subject.frame_rate
+        second_frame_rate = Microphone().frame_rate
+
+        # Assert
+        assert first_frame_rate == second_frame_rate == 16000
+        mock_pa_instance.get_default_input_device_info.assert_called_once_with()
+
+    @staticmethod
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_terminating_shared_pyaudio(mock_pyaudio):
+        # Arrange
+        mock_pa_instance = MagicMock()
+        mock_pyaudio.return_value = mock_pa_instance
+        Microphone()
+
+        # Act
+        microphone._terminate_pyaudio()
+        Microphone()
+
+        # Assert
+        mock_pa_instance.terminate.assert_called_once_with()
+        assert mock_pyaudio.call_count == 2
+
+    @staticmethod
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_terminating_shared_pyaudio_forgets_device_information(mock_pyaudio):
+        # Arrange
+        first_pa_instance, second_pa_instance = MagicMock(), MagicMock()
+        first_pa_instance.get_device_count.return_value = 1
+        first_pa_instance.get_device_info_by_index.return_value = {"name": "first device", "defaultSampleRate": 8000}
+        second_pa_instance.get_device_count.return_value = 1
+        second_pa_instance.get_device_info_by_index.return_value = {"name": "second device", "defaultSampleRate": 16000}
+        mock_pyaudio.side_effect = [first_pa_instance, second_pa_instance]
+        Microphone.get_device_names()
+        _ = Microphone(0).frame_rate
+
+        # Act
+        microphone._terminate_pyaudio()
+        actual_device_names = Microphone.get_device_names()
+        actual_frame_rate = Microphone(0).frame_rate
+
+        # Assert
+        assert actual_device_names == ["second device"]
+        assert actual_frame_rate == 16000
+
+    @staticmethod
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_close_releases_stream(mock_pyaudio):
+        # Arrange
+        mock_input_source = MagicMock()
+        mock_pa_instance = MagicMock()
+        mock_pa_instance.open = MagicMock(return_value=mock_input_source)
         mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
+        mock_pyaudio.return_value = mock_pa_instance
         subject = Microphone()
-        subject.read_bytes = MagicMock(return_value=b"0")
+        subject.read_bytes(1)
+
+        # Act
+        subject.close()
+
+        # Assert
+        mock_input_source.stop_stream.assert_called_once_with()
+        mock_input_source.close.assert_called_once_with()
+        mock_pa_instance.terminate.assert_not_called()
+
+    @staticmethod
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio")
+    def test_context_manager_closes_microphone(mock_pyaudio):
+        # Arrange
+        mock_input_source = MagicMock()
+        mock_pa_instance = MagicMock()
+        mock_pa_instance.open = MagicMock(return_value=mock_input_source)
+        mock_pyaudio.return_value = mock_pa_instance
 
-        with io.BytesIO(b"0") as fp:
-            expected_audio_segment = AudioSegment.from_raw(
-                fp,
-                sample_width=subject.frame_width,
-                frame_rate=subject.frame_rate,
-                channels=subject.n_channels,
-            )
+        # Act
+        with Microphone() as subject:
+            subject.read_bytes(1)
+
+        # Assert
+        mock_input_source.close.assert_called_once_with()
+
+    @staticmethod
+    def test_read_pydub(microphone_reading_silence):
+        # Arrange
+        subject, mock_pa_instance = microphone_reading_silence
+
+        expected_audio_segment = SILENCE_SEGMENT
 
         # Act
         actual_audio_segment = subject.read_pydub(2)
 
         # Assert
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pa_instance.terminate.assert_not_called()
         subject.read_bytes.assert_called_once_with(2)
         assert actual_audio_segment == expected_audio_segment
 
     @staticmethod
-    def test_read_with_frames_given():
+    @patch("donkey_ears.audio.microphone.pyaudio.PyAudio", MagicMock())
+    def test_read_pydub_looks_up_audio_format_once():
         # Arrange
-        mock_pa_instance = MagicMock()
-        mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
         subject = Microphone()
-        subject.read_bytes = MagicMock(return_value=b"0")
-
-        with io.BytesIO(b"0") as fp:
-            expected_audio = AudioSample(
-                AudioSegment.from_raw(
-                    fp,
-                    sample_width=subject.frame_width,
-                    frame_rate=subject.frame_rate,
-                    channels=subject.n_channels,
-                )
-            )
+        subject.read_bytes = MagicMock(return_value=b"\x00\x00")
+
+        # Act
+        with patch.object(Microphone, "frame_width", new_callable=PropertyMock, return_value=2) as mock_frame_width:
+            first_audio_segment = subject.read_pydub(1)
+            second_audio_segment = subject.read_pydub(1)
+
+        # Assert
+        mock_frame_width.assert_called_once_with()
+        assert first_audio_segment == second_audio_segment
+
+    @staticmethod
+    def test_read_with_frames_given(microphone_reading_silence):
+        # Arrange
+        subject, mock_pa_instance = microphone_reading_silence
+
+        expected_audio = AudioSample(SILENCE_SEGMENT)
 
         # Act
         actual_audio = subject.read(2)
 
         # Assert
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
+        mock_pa_instance.terminate.assert_not_called()
         subject.read_bytes.assert_called_once_with(2)
         assert actual_audio == expected_audio
 
     @staticmethod
-    def test_default_frame_count_used_when_read_called_with_no_frame_count_given():
+    def test_default_frame_count_used_when_read_called_with_no_frame_count_given(microphone_reading_silence):
         # Arrange
-        mock_pa_instance = MagicMock()
-        mock_pa_instance.terminate = MagicMock()
-        pyaudio.PyAudio = MagicMock(return_value=mock_pa_instance)
-        subject = Microphone()
-        subject.read_bytes = MagicMock(return_value=b"0")
-
-        with io.BytesIO(b"0") as fp:
-            expected_audio = AudioSample(
-                AudioSegment.from_raw(
-                    fp,
-                    sample_width=subject.frame_width,
-                    frame_rate=subject.frame_rate,
-                    channels=subject.n_channels,
-                )
-            )
+        subject, mock_pa_instance = microphone_reading_silence
+
+        expected_audio = AudioSample(SILENCE_SEGMENT)
 
         # Act
         actual_audio = subject.read(None)
 
         # Assert
-        assert mock_pa_instance.terminate.call_count == pyaudio.PyAudio.call_count
-        subject.read_bytes.assert_called_once_with(subject.DEFAULT_READ_DURATION_SECONDS)
+        mock_pa_instance.terminate.assert_not_called()
+        subject.read_bytes.assert_called_once_with(subject.DEFAULT_READ_DURATION_FRAMES)
         assert actual_audio == expected_audio
@@ -1,11 +1,15 @@
 # pylint: disable=protected-access
 
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, PropertyMock
 
+import numpy as np
 import pytest
 
-from donkey_ears.audio.base import AudioSample
+from donkey_ears.audio.base import AudioSample, BaseAudioSource
 from donkey_ears.listeners.audio import (
+    AdaptiveSilenceListener,
     AnnotatedFrame,
     BaseStateListener,
     ContinuousListener,
@@ -17,32 +21,68 @@ from donkey_ears.listeners.audio import (
     TimeBasedListener,
 )
 
+SILENCE_1S = AudioSample.generate_silence(1, 44100)
+SILENCE_2S = AudioSample.generate_silence(2, 44100)
+SILENCE_3S = AudioSample.generate_silence(3, 44100)
+SILENCE_4S = AudioSample.generate_silence(4, 44100)
+
+FRAME_LISTEN_1S = AnnotatedFrame(SILENCE_1S, FrameStateEnum.LISTEN)
+FRAME_LISTEN_2S = AnnotatedFrame(SILENCE_2S, FrameStateEnum.LISTEN)
+FRAME_LISTEN_3S = AnnotatedFrame(SILENCE_3S, FrameStateEnum.LISTEN)
+FRAME_LISTEN_4S = AnnotatedFrame(SILENCE_4S, FrameStateEnum.LISTEN)
+FRAME_PAUSE_1S = AnnotatedFrame(SILENCE_1S, FrameStateEnum.PAUSE)
+FRAME_PAUSE_2S = AnnotatedFrame(SILENCE_2S, FrameStateEnum.PAUSE)
+FRAME_PAUSE_3S = AnnotatedFrame(SILENCE_3S, FrameStateEnum.PAUSE)
+FRAME_STOP_1S = AnnotatedFrame(SILENCE_1S, FrameStateEnum.STOP)
+FRAME_STOP_3S = AnnotatedFrame(SILENCE_3S, FrameStateEnum.STOP)
+
+RECORDED_SAMPLES = [SILENCE_1S, SILENCE_2S]
+
+DUMMY_SOURCE = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def state_listener():
+    return BaseStateListener(DUMMY_SOURCE)
+
 
 class TestListener:
     @staticmethod
     def test_read_sample():
-        audio_source = MagicMock()
-        audio_source.read = MagicMock(return_value=AudioSample.generate_silence(1, 44100))
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.read = MagicMock(return_value=SILENCE_1S)
         subject = Listener(audio_source)
 
         actual = subject.read()
 
         audio_source.read.assert_called_once()
-        assert actual == AudioSample.generate_silence(1, 44100)
+        assert actual == SILENCE_1S
 
     @staticmethod
     def test_chunk_size_passed_to_source_read_method():
-        audio_source = MagicMock()
-        audio_source.read = MagicMock(return_value=AudioSample.generate_silence(1, 44100))
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.read = MagicMock(return_value=SILENCE_1S)
         subject = Listener(audio_source)
 
         subject.read(22050)
 
         audio_source.read.assert_called_once_with(22050)
 
+    @staticmethod
+    def test_default_chunk_size_is_based_on_source_frame_rate():
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.seconds_to_frame = MagicMock(return_value=4000)
+        audio_source.read = MagicMock(return_value=AudioSample.generate_silence(1, 16000))
+        subject = Listener(audio_source)
+
+        subject.read()
+
+        audio_source.seconds_to_frame.assert_called_once_with(Listener.DEFAULT_READ_DURATION_SECONDS)
+        audio_source.read.assert_called_once_with(4000)
+
     @staticmethod
     def test_no_audio_available():
-        audio_source = MagicMock()
+        audio_source = MagicMock(spec_set=BaseAudioSource)
         audio_source.read = MagicMock(side_effect=EOFError)
         subject = Listener(audio_source)
 
@@ -51,22 +91,18 @@ class TestListener:
 
     @staticmethod
     def test_iterating_over_listener_returns_samples_recorded():
-        audio_source = MagicMock()
-        audio_source.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100), EOFError]
-        )
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.read = MagicMock(side_effect=[*RECORDED_SAMPLES, EOFError])
         subject = Listener(audio_source)
 
         results = list(subject)
 
-        assert results == [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+        assert results == RECORDED_SAMPLES
 
     @staticmethod
     def test_getting_continuous_listener():
-        audio_source = MagicMock()
-        audio_source.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100), EOFError]
-        )
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.read = MagicMock(side_effect=[*RECORDED_SAMPLES, EOFError])
         listener = Listener(audio_source)
 
         subject = listener.continuous_listener()
@@ -79,16 +115,14 @@ class TestListener:
 
     @staticmethod
     def test_getting_continuous_listener_as_part_of_context_manager():
-        audio_source = MagicMock()
-        audio_source.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100), EOFError]
-        )
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.read = MagicMock(side_effect=[*RECORDED_SAMPLES, EOFError])
         subject = Listener(audio_source)
 
         with subject.continuous_listener() as clistener:
             assert isinstance(clistener, ContinuousListener)
             assert clistener.listener is subject
-            assert list(clistener) == [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+            assert list(clistener) == RECORDED_SAMPLES
 
         assert not clistener.is_listening
 
@@ -103,9 +137,9 @@ class TestContinuousListener:
     @staticmethod
     def test_is_listening_returns_true_after_starting():
         subject = ContinuousListener(MagicMock())
-        subject.start()
 
-        assert subject.is_listening is True
+        with subject.listen():
+            assert subject.is_listening is True
 
     @staticmethod
     def test_is_listening_returns_false_after_starting_then_stopping():
@@ -118,13 +152,14 @@ class TestContinuousListener:
     @staticmethod
     def test_double_starting_listener_raises_exception():
         subject = ContinuousListener(MagicMock())
-        subject.start()
-        with pytest.raises(ListenerRunningError):
-            subject.start()
+
+        with subject.listen():
+            with pytest.raises(ListenerRunningError):
+                subject.start()
 
     @staticmethod
     def test_source_read_called_when_listener_started():
-        listener = MagicMock()
+        listener = MagicMock(spec_set=Listener)
         listener.read = MagicMock()
         subject = ContinuousListener(listener)
         subject.start()
@@ -134,39 +169,34 @@ class TestContinuousListener:
 
     @staticmethod
     def test_read():
-        listener = MagicMock()
-        listener.read = MagicMock(side_effect=[AudioSample.generate_silence(1, 44100), EOFError])
-        subject = ContinuousListener(listener)
-        subject.start()
-        subject.stop()
+        subject = ContinuousListener(MagicMock())
+        subject._store_recording(SILENCE_1S)
+        subject._store_recording_stopped()
 
         result = subject.read()
 
-        assert result == AudioSample.generate_silence(1, 44100)
+        assert result == SILENCE_1S
         with pytest.raises(NoAudioAvailable):
             subject.read()
 
     @staticmethod
     def test_read_while_started():
-        listener = MagicMock()
-        listener.read = MagicMock(side_effect=[AudioSample.generate_silence(1, 44100), EOFError])
+        listener = MagicMock(spec_set=Listener)
+        listener.read = MagicMock(side_effect=[SILENCE_1S, EOFError])
         subject = ContinuousListener(listener)
         subject.start()
 
         result = subject.read()
         subject.stop()
 
-        assert result == AudioSample.generate_silence(1, 44100)
+        assert result == SILENCE_1S
         with pytest.raises(NoAudioAvailable):
             subject.read()
 
     @staticmethod
     def test_read_raises_exception_when_listener_immediately_raises_eoferror():
-        listener = MagicMock()
-        listener.read = MagicMock(side_effect=[EOFError])
-        subject = ContinuousListener(listener)
-        subject.start()
-        subject.stop()
+        subject = ContinuousListener(MagicMock())
+        subject._store_recording_stopped()
 
         with pytest.raises(NoAudioAvailable):
             subject.read()
@@ -186,39 +216,157 @@ class TestContinuousListener:
             (0, False, None),
             (0.5, True, 0.5),
             (1, True, 1),
+            (-1, True, None),
             (True, True, None),
         ],
+        ids=["false", "zero", "half", "one", "negative", "true"],
     )
-    def test_read_passes_arguments_to_queue_get(wait, expected_blocking, expected_timeout):
-        listener = MagicMock()
-        listener.read = MagicMock(side_effect=[AudioSample.generate_silence(1, 44100), EOFError])
-        subject = ContinuousListener(listener)
+    def test_translating_wait_to_queue_get_arguments(wait, expected_blocking, expected_timeout):
+        actual = ContinuousListener._translate_wait(wait)
+
+        assert actual == (expected_blocking, expected_timeout)
+
+    @staticmethod
+    def test_read_passes_arguments_to_queue_get():
+        subject = ContinuousListener(MagicMock())
         subject._recordings = MagicMock()  # pylint: disable=protected-access
         subject._recordings.get = MagicMock()  # pylint: disable=protected-access
         subject._recordings.empty = MagicMock(return_value=False)  # pylint: disable=protected-access
-        subject.start()
-        subject.stop()
 
-        subject.read(wait)
+        subject.read(0.5)
 
-        subject._recordings.get.assert_called_once()  # pylint: disable=protected-access
-        subject._recordings.get.assert_called_once_with(  # pylint: disable=protected-access
-            expected_blocking, expected_timeout
-        )
+        subject._recordings.get.assert_called_once_with(True, 0.5)  # pylint: disable=protected-access
 
     @staticmethod
     def test_iterating_over_listener_returns_samples_recorded():
-        listener = MagicMock()
-        listener.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100), EOFError]
-        )
-        subject = ContinuousListener(listener)
+        subject = ContinuousListener(MagicMock())
+        for sample in RECORDED_SAMPLES:
+            subject._store_recording(sample)
+        subject._store_recording_stopped()
+
+        results = list(subject)
+
+        assert results == RECORDED_SAMPLES
+
+    @staticmethod
+    def test_bounded_queue_drops_when_full():
+        subject = ContinuousListener(MagicMock(), max_recordings=2)
+        for sample in [SILENCE_1S, SILENCE_2S, SILENCE_3S]:
+            subject._store_recording(sample)
+        subject._store_recording_stopped()
+
+        results = list(subject)
+
+        assert results == [SILENCE_1S, SILENCE_2S]
+        assert subject.dropped_count == 1
+
+    @staticmethod
+    def test_bounded_queue_evict_oldest():
+        subject = ContinuousListener(MagicMock(), max_recordings=2, overflow="evict")
+        for sample in [SILENCE_1S, SILENCE_2S, SILENCE_3S]:
+            subject._store_recording(sample)
+        subject._store_recording_stopped()
+
+        results = list(subject)
+
+        assert results == [SILENCE_2S, SILENCE_3S]
+        assert subject.dropped_count == 1
+
+    @staticmethod
+    def test_evicting_keeps_end_of_listener_marker_in_place():
+        subject = ContinuousListener(MagicMock(), max_recordings=2, overflow="evict")
+        subject._store_recording_stopped()
+        for sample in [SILENCE_1S, SILENCE_2S, SILENCE_3S]:
+            subject._store_recording(sample)
+
+        results_before_marker = list(subject)
+        results_after_marker = list(subject)
+
+        assert results_before_marker == []
+        assert results_after_marker == [SILENCE_2S, SILENCE_3S]
+        assert subject.dropped_count == 1
+
+    @staticmethod
+    def test_evicting_past_end_of_listener_marker_keeps_recordings_bounded():
+        subject = ContinuousListener(MagicMock(), max_recordings=2, overflow="evict")
+        subject._store_recording_stopped()
+        for sample in [SILENCE_1S, SILENCE_2S, SILENCE_3S]:
+            subject._store_recording(sample)
+        list(subject)
+        list(subject)
+
+        for sample in [SILENCE_1S, SILENCE_2S, SILENCE_3S]:
+            subject._store_recording(sample)
+        subject._store_recording_stopped()
+        results = list(subject)
+
+        assert results == [SILENCE_2S, SILENCE_3S]
+        assert subject.dropped_count == 2
+
+    @staticmethod
+    def test_reading_makes_room_in_bounded_queue():
+        subject = ContinuousListener(MagicMock(), max_recordings=1)
+        subject._store_recording(SILENCE_1S)
+        first_result = subject.read()
+        subject._store_recording(SILENCE_2S)
+        subject._store_recording_stopped()
+
+        results = [first_result, *subject]
+
+        assert results == RECORDED_SAMPLES
+        assert subject.dropped_count == 0
+
+    @staticmethod
+    def test_producer_blocks_when_queue_full():
+        third_sample_heard = threading.Event()
+
+        def read_samples_then_eof():
+            if listener.read.call_count > len(RECORDED_SAMPLES) + 1:
+                raise EOFError()
+            if listener.read.call_count == len(RECORDED_SAMPLES) + 1:
+                third_sample_heard.set()
+            return [*RECORDED_SAMPLES, SILENCE_3S][listener.read.call_count - 1]
+
+        listener = MagicMock(spec_set=Listener)
+        listener.read = MagicMock(side_effect=read_samples_then_eof)
+        subject = ContinuousListener(listener, max_recordings=2, overflow="block")
         subject.start()
-        subject.stop()
+
+        assert third_sample_heard.wait(5)
+        time.sleep(2 * subject.POLL_SECONDS)
+        assert subject.is_listening is True
+        assert listener.read.call_count == 3
 
         results = list(subject)
 
-        assert results == [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+        assert results == [*RECORDED_SAMPLES, SILENCE_3S]
+        assert subject.dropped_count == 0
+
+    @staticmethod
+    def test_stopping_blocked_producer_drops_waiting_recording():
+        second_sample_heard = threading.Event()
+
+        def read_and_signal_second_sample():
+            if listener.read.call_count == 2:
+                second_sample_heard.set()
+            return SILENCE_1S
+
+        listener = MagicMock(spec_set=Listener)
+        listener.read = MagicMock(side_effect=read_and_signal_second_sample)
+        subject = ContinuousListener(listener, max_recordings=1, overflow="block")
+        subject.start()
+        assert second_sample_heard.wait(5)
+
+        stopped = subject.stop(timeout=5)
+
+        assert stopped is True
+        assert subject.dropped_count == 1
+        assert list(subject) == [SILENCE_1S]
+
+    @staticmethod
+    def test_unknown_overflow_policy_is_invalid():
+        with pytest.raises(ValueError):
+            ContinuousListener(MagicMock(), overflow="grow")
 
     @staticmethod
     def test_context_manager():
@@ -236,32 +384,28 @@ class TestContinuousListener:
                 self.stop_call_count += 1
                 super().stop(timeout)
 
-        listener = MagicMock()
-        listener.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100), EOFError]
-        )
+        listener = MagicMock(spec_set=Listener)
+        listener.read = MagicMock(side_effect=[*RECORDED_SAMPLES, EOFError])
         subject = SubjectContinuousListen(listener)
 
         with subject.listen() as continuous_listen:
             results = list(continuous_listen)
 
-        assert results == [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+        assert results == RECORDED_SAMPLES
         assert subject.start_call_count == 1
         assert subject.stop_call_count == 1
 
     @staticmethod
     def test_using_in_context_manager():
-        audio_source = MagicMock()
-        audio_source.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100), EOFError]
-        )
+        audio_source = MagicMock(spec_set=BaseAudioSource)
+        audio_source.read = MagicMock(side_effect=[*RECORDED_SAMPLES, EOFError])
         listener = Listener(audio_source)
         subject = ContinuousListener(listener)
 
         with subject.listen() as clistener:
             assert clistener is subject
             assert clistener.listener is listener
-            assert list(clistener) == [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+            assert list(clistener) == RECORDED_SAMPLES
 
         assert not clistener.is_listening
 
@@ -276,17 +420,17 @@ class TestBaseStateListener:
                 return FrameStateEnum.LISTEN
 
         audio_source = MagicMock()
-        audio_source.read = MagicMock(return_value=AudioSample.generate_silence(1, 44100))
+        audio_source.read = MagicMock(return_value=SILENCE_1S)
         subject = StateListener(audio_source)
 
         actual = subject._listen_frames(2**14)
 
         assert audio_source.read.call_count == 4
         assert actual == [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.STOP),
+            FRAME_LISTEN_1S,
+            FRAME_LISTEN_1S,
+            FRAME_LISTEN_1S,
+            FRAME_STOP_1S,
         ]
 
     @staticmethod
@@ -296,13 +440,13 @@ class TestBaseStateListener:
                 return FrameStateEnum.STOP
 
         audio_source = MagicMock()
-        audio_source.read = MagicMock(return_value=AudioSample.generate_silence(1, 44100))
+        audio_source.read = MagicMock(return_value=SILENCE_1S)
         subject = StateListener(audio_source)
 
         actual = subject._listen_frames(2**14)
 
         assert audio_source.read.call_count == 1
-        assert actual == [AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.STOP)]
+        assert actual == [FRAME_STOP_1S]
 
     @staticmethod
     def test_listening_to_frames_when_end_of_source_eventually_encountered():
@@ -313,139 +457,109 @@ class TestBaseStateListener:
                 return FrameStateEnum.LISTEN
 
         audio_source = MagicMock()
-        audio_source.read = MagicMock(
-            side_effect=[AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(1, 44100), EOFError()]
-        )
+        audio_source.read = MagicMock(side_effect=[SILENCE_1S, SILENCE_1S, EOFError()])
         subject = StateListener(audio_source)
 
         actual = subject._listen_frames(2**14)
 
         assert audio_source.read.call_count == 3
         assert actual == [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-        ]
-
-    @staticmethod
-    def test_filtering_samples_with_no_trailing_stop():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.LISTEN),
-        ]
-
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == input_frames
-
-    @staticmethod
-    def test_filtering_samples_with_trailing_stop():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.STOP),
-        ]
-
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == input_frames
-
-    @staticmethod
-    def test_filtering_empty_sample_list():
-        subject = BaseStateListener(MagicMock())
-        input_frames = []
-
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == input_frames
-
-    @staticmethod
-    def test_filtering_samples_with_single_pause_in_middle():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.LISTEN),
+            FRAME_LISTEN_1S,
+            FRAME_LISTEN_1S,
         ]
 
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == input_frames
-
     @staticmethod
-    def test_filtering_samples_with_multiple_pauses_in_middle():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(4, 44100), FrameStateEnum.LISTEN),
-        ]
-
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(4, 44100), FrameStateEnum.LISTEN),
-        ]
-
-    @staticmethod
-    def test_filtering_samples_with_stop_as_only_sample():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.STOP),
-        ]
-
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == []
-
-    @staticmethod
-    def test_filtering_samples_with_pause_at_start():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.LISTEN),
-        ]
-
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == [
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.LISTEN),
-        ]
-
-    @staticmethod
-    def test_filtering_samples_with_multiple_pauses_at_start():
-        subject = BaseStateListener(MagicMock())
-        input_frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(2, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(4, 44100), FrameStateEnum.LISTEN),
-        ]
+    @pytest.mark.parametrize(
+        "input_frames, expected_frames",
+        [
+            (
+                [FRAME_LISTEN_1S, FRAME_LISTEN_2S],
+                [FRAME_LISTEN_1S, FRAME_LISTEN_2S],
+            ),
+            (
+                [
+                    FRAME_LISTEN_1S,
+                    FRAME_LISTEN_2S,
+                    FRAME_STOP_3S,
+                ],
+                [
+                    FRAME_LISTEN_1S,
+                    FRAME_LISTEN_2S,
+                    FRAME_STOP_3S,
+                ],
+            ),
+            ([], []),
+            (
+                [
+                    FRAME_LISTEN_1S,
+                    FRAME_PAUSE_2S,
+                    FRAME_LISTEN_3S,
+                ],
+                [
+                    FRAME_LISTEN_1S,
+                    FRAME_PAUSE_2S,
+                    FRAME_LISTEN_3S,
+                ],
+            ),
+            (
+                [
+                    FRAME_LISTEN_1S,
+                    FRAME_PAUSE_2S,
+                    FRAME_PAUSE_3S,
+                    FRAME_LISTEN_4S,
+                ],
+                [
+                    FRAME_LISTEN_1S,
+                    FRAME_PAUSE_2S,
+                    FRAME_LISTEN_4S,
+                ],
+            ),
+            ([FRAME_STOP_1S], []),
+            (
+                [
+                    FRAME_PAUSE_1S,
+                    FRAME_LISTEN_2S,
+                    FRAME_LISTEN_3S,
+                ],
+                [FRAME_LISTEN_2S, FRAME_LISTEN_3S],
+            ),
+            (
+                [
+                    FRAME_PAUSE_1S,
+                    FRAME_PAUSE_2S,
+                    FRAME_LISTEN_3S,
+                    FRAME_LISTEN_4S,
+                ],
+                [FRAME_LISTEN_3S, FRAME_LISTEN_4S],
+            ),
+        ],
+        ids=[
+            "no trailing stop",
+            "trailing stop",
+            "empty",
+            "single pause in middle",
+            "multiple pauses in middle",
+            "stop as only sample",
+            "pause at start",
+            "multiple pauses at start",
+        ],
+    )
+    def test_filtering_samples(state_listener, input_frames, expected_frames):
+        actual = state_listener._filter_audio_samples(input_frames)
 
-        actual = subject._filter_audio_samples(input_frames)
-
-        assert actual == [
-            AnnotatedFrame(AudioSample.generate_silence(3, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(4, 44100), FrameStateEnum.LISTEN),
-        ]
+        assert actual == expected_frames
 
     @staticmethod
     def test_joining_audio_frames():
         frames = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
+            FRAME_LISTEN_1S,
+            FRAME_LISTEN_1S,
         ]
-        subject = BaseStateListener(MagicMock())
+        subject = BaseStateListener(DUMMY_SOURCE)
 
         actual = subject._join_audio_samples(frames)
 
-        assert actual == AudioSample.generate_silence(2, 44100)
+        assert actual == SILENCE_2S
 
     @staticmethod
     def test_joining_audio_frames_when_no_frames_exist():
@@ -462,15 +576,15 @@ class TestBaseStateListener:
     @staticmethod
     def test_read_calls_other_methods():
         frames_heard = [
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.PAUSE),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.LISTEN),
-            AnnotatedFrame(AudioSample.generate_silence(1, 44100), FrameStateEnum.STOP),
+            FRAME_LISTEN_1S,
+            FRAME_PAUSE_1S,
+            FRAME_LISTEN_1S,
+            FRAME_STOP_1S,
         ]
         filtered_frames_heard = [frame for frame in frames_heard if frame.state != FrameStateEnum.PAUSE]
-        joined_sample = AudioSample.generate_silence(2, 44100)
+        joined_sample = SILENCE_2S
         post_processed_sample = AudioSample.generate_silence(1.5, 44100)
-        subject = BaseStateListener(MagicMock())
+        subject = BaseStateListener(DUMMY_SOURCE)
         subject._listen_frames = MagicMock(return_value=frames_heard)
         subject._filter_audio_samples = MagicMock(return_value=filtered_frames_heard)
         subject._join_audio_samples = MagicMock(return_value=joined_sample)
@@ -484,13 +598,86 @@ class TestBaseStateListener:
         subject._post_process_final_audio_sample.assert_called_once_with(joined_sample)
         assert actual == post_processed_sample
 
+    @staticmethod
+    def test_stream_yields_the_frames_read_would_join():
+        class StateListener(BaseStateListener):  # pylint: disable=too-few-public-methods
+            states = [FrameStateEnum.PAUSE, FrameStateEnum.LISTEN, FrameStateEnum.PAUSE, FrameStateEnum.LISTEN]
+
+            def _determine_frame_state(self, latest_frame, all_frames):
+                if len(all_frames) < len(self.states):
+                    return self.states[len(all_frames)]
+                return FrameStateEnum.STOP
+
+        frames = [AudioSample.from_numpy(np.full(10, value, dtype="int16"), 44100) for value in range(5)]
+        read_subject = StateListener(MagicMock(read=MagicMock(side_effect=frames)))
+        stream_subject = StateListener(MagicMock(read=MagicMock(side_effect=frames)))
+
+        expected = read_subject.read(10)
+        actual = list(stream_subject.stream(10))
+
+        assert actual == [frames[1], frames[2], frames[3], frames[4]]
+        assert AudioSample.from_iterable(actual) == expected
+
+    @staticmethod
+    def test_stream_yields_empty_sample_when_nothing_heard():
+        class StateListener(BaseStateListener):  # pylint: disable=too-few-public-methods
+            def _determine_frame_state(self, latest_frame, all_frames):  # pylint: disable=unused-argument
+                return FrameStateEnum.STOP
+
+        audio_source = MagicMock()
+        audio_source.frame_rate = 44100
+        audio_source.read = MagicMock(return_value=SILENCE_1S)
+        subject = StateListener(audio_source)
+
+        actual = list(subject.stream(10))
+
+        assert len(actual) == 1
+        assert actual[0].n_frames == 0
+
+    @staticmethod
+    def test_stream_yields_read_sample_when_joining_is_overridden():
+        class StateListener(BaseStateListener):  # pylint: disable=too-few-public-methods
+            def _post_process_final_audio_sample(self, audio):
+                return audio.invert_phase()
+
+        subject = StateListener(DUMMY_SOURCE)
+        subject.read = MagicMock(return_value=SILENCE_1S)
+
+        actual = list(subject.stream(10))
+
+        assert actual == [SILENCE_1S]
+        subject.read.assert_called_once_with(10)
+
+    @staticmethod
+    def test_stream_yields_read_sample_when_read_is_overridden():
+        class StateListener(BaseStateListener):  # pylint: disable=too-few-public-methods
+            def read(self, n_frames=None):
+                return SILENCE_2S
+
+        subject = StateListener(DUMMY_SOURCE)
+
+        actual = list(subject.stream(10))
+
+        assert actual == [SILENCE_2S]
+
+    @staticmethod
+    def test_stream_yields_read_sample_when_listening_to_frames_is_overridden():
+        class StateListener(BaseStateListener):  # pylint: disable=too-few-public-methods
+            def _listen_frames(self, n_frames):
+                return [FRAME_LISTEN_1S, FRAME_STOP_1S]
+
+        subject = StateListener(DUMMY_SOURCE)
+
+        actual = list(subject.stream(10))
+
+        assert actual == [subject.read(10)]
+
 
 class TestSilenceBasedListener:
     @staticmethod
     def test_frame_above_threshold_is_labeled_listen():
-        subject = SilenceBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
-        latest_frame.rms = 200
+        subject = SilenceBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = AudioSample.from_numpy(np.full(1_000, 200, dtype="int16"), 44100)
 
         actual = subject._determine_frame_state(latest_frame, [])
 
@@ -498,9 +685,8 @@ class TestSilenceBasedListener:
 
     @staticmethod
     def test_frame_below_threshold_with_no_previous_frames_is_labeled_pause():
-        subject = SilenceBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
-        latest_frame.rms = 0
+        subject = SilenceBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = AudioSample.from_numpy(np.zeros(1_000, dtype="int16"), 44100)
 
         actual = subject._determine_frame_state(latest_frame, [])
 
@@ -508,9 +694,8 @@ class TestSilenceBasedListener:
 
     @staticmethod
     def test_frame_below_threshold_with_previous_frame_labeled_pause_is_labeled_pause():
-        subject = SilenceBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
-        latest_frame.rms = 0
+        subject = SilenceBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = AudioSample.from_numpy(np.zeros(1_000, dtype="int16"), 44100)
 
         actual = subject._determine_frame_state(latest_frame, [AnnotatedFrame(MagicMock(), FrameStateEnum.PAUSE)])
 
@@ -518,20 +703,77 @@ class TestSilenceBasedListener:
 
     @staticmethod
     def test_frame_below_threshold_with_previous_frame_labeled_listen_is_labeled_stop():
-        subject = SilenceBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
-        latest_frame.rms = 0
+        subject = SilenceBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = AudioSample.from_numpy(np.zeros(1_000, dtype="int16"), 44100)
 
         actual = subject._determine_frame_state(latest_frame, [AnnotatedFrame(MagicMock(), FrameStateEnum.LISTEN)])
 
         assert actual == FrameStateEnum.STOP
 
+    @staticmethod
+    def test_frame_at_threshold_is_not_labeled_listen():
+        subject = SilenceBasedListener(DUMMY_SOURCE, 200)
+        latest_frame = AudioSample.from_numpy(np.full(1_000, 200, dtype="int16"), 44100)
+
+        actual = subject._determine_frame_state(latest_frame, [])
+
+        assert actual == FrameStateEnum.PAUSE
+
+    @staticmethod
+    def test_changing_threshold_is_used_for_later_frames():
+        subject = SilenceBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = AudioSample.from_numpy(np.full(1_000, 200, dtype="int16"), 44100)
+
+        subject.silence_threshold_rms = 500
+        actual = subject._determine_frame_state(latest_frame, [])
+
+        assert subject.silence_threshold_rms == 500
+        assert actual == FrameStateEnum.PAUSE
+
+
+class TestAdaptiveSilenceListener:
+    @staticmethod
+    def test_threshold_unchanged_until_there_are_two_peaks():
+        subject = AdaptiveSilenceListener(DUMMY_SOURCE, 500, update_interval=4)
+        quiet_frame = AudioSample.from_numpy(np.full(100, 100, dtype="int16"), 44100)
+
+        for _ in range(8):
+            subject._determine_frame_state(quiet_frame, [])
+
+        assert subject.silence_threshold_rms == 500
+
+    @staticmethod
+    def test_threshold_is_weighted_between_silence_and_speech_peaks():
+        subject = AdaptiveSilenceListener(DUMMY_SOURCE, 500, weight=5, update_interval=16, n_bins=32)
+        quiet_frame = AudioSample.from_numpy(np.full(100, 100, dtype="int16"), 44100)
+        loud_frame = AudioSample.from_numpy(np.full(100, 1000, dtype="int16"), 44100)
+
+        for frame in [quiet_frame] * 12 + [loud_frame] * 4:
+            subject._determine_frame_state(frame, [])
+
+        # The peaks are the centers of the first and last of 32 bins spanning 100 to 1000
+        bin_width = (1000 - 100) / 32
+        expected = int((5 * (100 + bin_width / 2) + (1000 - bin_width / 2)) / 6)
+        assert subject.silence_threshold_rms == expected
+
+    @staticmethod
+    def test_updated_threshold_is_used_for_frame_state():
+        subject = AdaptiveSilenceListener(DUMMY_SOURCE, 5_000, update_interval=16)
+        quiet_frame = AudioSample.from_numpy(np.full(100, 100, dtype="int16"), 44100)
+        loud_frame = AudioSample.from_numpy(np.full(100, 1000, dtype="int16"), 44100)
+        for frame in [quiet_frame] * 12 + [loud_frame] * 3:
+            subject._determine_frame_state(frame, [])
+
+        actual = subject._determine_frame_state(loud_frame, [])
+
+        assert actual == FrameStateEnum.LISTEN
+
 
 class TestTimeBasedListener:
     @staticmethod
     def test_first_frame_labeled_listen_if_shorter_than_total_duration():
-        subject = TimeBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
+        subject = TimeBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = MagicMock(spec_set=AudioSample)
         latest_frame.n_seconds = 1
         latest_frame.__len__ = MagicMock(return_value=44100)
 
@@ -541,8 +783,8 @@ class TestTimeBasedListener:
 
     @staticmethod
     def test_first_frame_labeled_listen_if_equal_to_total_duration():
-        subject = TimeBasedListener(MagicMock(), 1)
-        latest_frame = MagicMock()
+        subject = TimeBasedListener(DUMMY_SOURCE, 1)
+        latest_frame = MagicMock(spec_set=AudioSample)
         latest_frame.n_seconds = 1
         latest_frame.__len__ = MagicMock(return_value=44100)
 
@@ -552,8 +794,8 @@ class TestTimeBasedListener:
 
     @staticmethod
     def test_first_frame_labeled_listen_if_longer_than_total_duration():
-        subject = TimeBasedListener(MagicMock(), 1)
-        latest_frame = MagicMock()
+        subject = TimeBasedListener(DUMMY_SOURCE, 1)
+        latest_frame = MagicMock(spec_set=AudioSample)
         latest_frame.n_seconds = 2
         latest_frame.__len__ = MagicMock(return_value=2 * 44100)
 
@@ -561,10 +803,23 @@ class TestTimeBasedListener:
 
         assert actual == FrameStateEnum.LISTEN
 
+    @staticmethod
+    def test_changing_total_duration_is_used_for_later_frames():
+        subject = TimeBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = MagicMock(spec_set=AudioSample)
+        latest_frame.n_seconds = 1
+        latest_frame.__len__ = MagicMock(return_value=44100)
+
+        subject.total_duration = 1.5
+        actual = subject._determine_frame_state(latest_frame, [FRAME_LISTEN_1S])
+
+        assert subject.total_duration == 1.5
+        assert actual == FrameStateEnum.STOP
+
     @staticmethod
     def test_first_frame_labeled_pause_if_frame_has_no_duration():
-        subject = TimeBasedListener(MagicMock(), 1)
-        latest_frame = MagicMock()
+        subject = TimeBasedListener(DUMMY_SOURCE, 1)
+        latest_frame = MagicMock(spec_set=AudioSample)
         latest_frame.n_seconds = 0
         latest_frame.__len__ = MagicMock(return_value=0)
 
@@ -574,11 +829,11 @@ class TestTimeBasedListener:
 
     @staticmethod
     def test_frame_labeled_pause_if_frame_has_no_duration():
-        subject = TimeBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
+        subject = TimeBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = MagicMock(spec_set=AudioSample)
         latest_frame.n_seconds = 0
         latest_frame.__len__ = MagicMock(return_value=0)
-        existing_frame = MagicMock()
+        existing_frame = MagicMock(spec_set=AudioSample)
         existing_frame.n_seconds = 1
 
         actual = subject._determine_frame_state(latest_frame, [AnnotatedFrame(existing_frame, FrameStateEnum.LISTEN)])
@@ -587,13 +842,56 @@ class TestTimeBasedListener:
 
     @staticmethod
     def test_frame_labeled_stop_if_frame_pushes_duration_over_total():
-        subject = TimeBasedListener(MagicMock(), 10)
-        latest_frame = MagicMock()
+        subject = TimeBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = MagicMock(spec_set=AudioSample)
         latest_frame.n_seconds = 1
         latest_frame.__len__ = MagicMock(return_value=44100)
-        existing_frame = MagicMock()
+        existing_frame = MagicMock(spec_set=AudioSample)
         existing_frame.n_seconds = 10
 
         actual = subject._determine_frame_state(latest_frame, [AnnotatedFrame(existing_frame, FrameStateEnum.LISTEN)])
 
         assert actual == FrameStateEnum.STOP
+
+    @staticmethod
+    def test_duration_of_earlier_frames_is_only_computed_once():
+        subject = TimeBasedListener(DUMMY_SOURCE, 10)
+        latest_frame = MagicMock(spec_set=AudioSample)
+        latest_frame.n_seconds = 4
+        latest_frame.__len__ = MagicMock(return_value=4 * 44100)
+        first_frame = MagicMock(spec_set=AudioSample)
+        first_frame_n_seconds = PropertyMock(return_value=4)
+        type(first_frame).n_seconds = first_frame_n_seconds
+        all_frames = [AnnotatedFrame(first_frame, FrameStateEnum.LISTEN)]
+
+        first_state = subject._determine_frame_state(latest_frame, all_frames)
+        all_frames.append(AnnotatedFrame(latest_frame, first_state))
+        second_state = subject._determine_frame_state(latest_frame, all_frames)
+
+        assert first_state == FrameStateEnum.LISTEN
+        assert second_state == FrameStateEnum.STOP
+        first_frame_n_seconds.assert_called_once_with()
+
+    @staticmethod
+    def test_reading_twice_returns_samples_of_total_duration():
+        audio_source = MagicMock()
+        audio_source.frame_rate = 44100
+        audio_source.read = MagicMock(return_value=SILENCE_1S)
+        subject = TimeBasedListener(audio_source, 3)
+
+        first_sample = subject.read(44100)
+        second_sample = subject.read(44100)
+
+        assert audio_source.read.call_count == 8
+        assert first_sample == second_sample
+
+    @staticmethod
+    def test_reading_duration_shorter_than_chunk_size():
+        audio_source = MagicMock()
+        audio_source.frame_rate = 44100
+        audio_source.read = MagicMock(return_value=AudioSample.generate_silence(0.1, 44100))
+        subject = TimeBasedListener(audio_source, 0.1)
+
+        subject.read(44100)
+
+        audio_source.read.assert_called_with(4410)
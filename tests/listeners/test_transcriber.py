@@ -1,20 +1,23 @@
 from unittest.mock import MagicMock, call
 
 from donkey_ears.audio.base import AudioSample
-from donkey_ears.listeners.audio import ContinuousListener, Listener
+from donkey_ears.listeners.audio import BaseStateListener, ContinuousListener, Listener
 from donkey_ears.listeners.transcriber import Transcriber
 from donkey_ears.speech_to_text.base import DetailedTranscript, DetailedTranscripts
 
+SILENCE_1S = AudioSample.generate_silence(1, 44100)
+SILENCE_2S = AudioSample.generate_silence(2, 44100)
+
 
 class TestTranscriber:
     @staticmethod
     def test_read_gets_sample_from_listener_and_sends_to_speech_to_text():
         listener = MagicMock()
-        audio_sample = AudioSample.generate_silence(1, 44100)
-        listener.read = MagicMock(return_value=audio_sample)
+        audio_sample = object()
+        listener.read.return_value = audio_sample
 
         speech_to_text = MagicMock()
-        speech_to_text.transcribe_audio = MagicMock(return_value="any text")
+        speech_to_text.transcribe_audio.return_value = "any text"
 
         subject = Transcriber(listener, speech_to_text)
 
@@ -27,8 +30,8 @@ class TestTranscriber:
     @staticmethod
     def test_read_detailed_gets_sample_from_listener_and_sends_to_speech_to_text():
         listener = MagicMock()
-        audio_sample = AudioSample.generate_silence(1, 44100)
-        listener.read = MagicMock(return_value=audio_sample)
+        audio_sample = object()
+        listener.read.return_value = audio_sample
 
         speech_to_text = MagicMock()
         detailed_transcription = DetailedTranscripts(
@@ -38,7 +41,7 @@ class TestTranscriber:
             ],
             None,
         )
-        speech_to_text.transcribe_audio_detailed = MagicMock(return_value=detailed_transcription)
+        speech_to_text.transcribe_audio_detailed.return_value = detailed_transcription
 
         subject = Transcriber(listener, speech_to_text)
 
@@ -50,15 +53,70 @@ class TestTranscriber:
             audio_sample, n_transcriptions=7, segment_timestamps=False
         )
 
+    @staticmethod
+    def test_read_streams_audio_from_state_listener():
+        listener = MagicMock(spec=BaseStateListener)
+        audio_stream = iter([object()])
+        listener.stream.return_value = audio_stream
+
+        speech_to_text = MagicMock()
+        speech_to_text.transcribe_audio_stream.return_value = "any text"
+
+        subject = Transcriber(listener, speech_to_text)
+
+        actual = subject.read()
+
+        assert actual == "any text"
+        listener.stream.assert_called_once_with()
+        listener.read.assert_not_called()
+        speech_to_text.transcribe_audio_stream.assert_called_once_with(audio_stream)
+
+    @staticmethod
+    def test_read_detailed_streams_audio_from_state_listener():
+        listener = MagicMock(spec=BaseStateListener)
+        audio_stream = iter([object()])
+        listener.stream.return_value = audio_stream
+
+        speech_to_text = MagicMock()
+        detailed_transcription = DetailedTranscripts([DetailedTranscript("any transcript", 0.99, None)], None)
+        speech_to_text.transcribe_audio_stream_detailed.return_value = detailed_transcription
+
+        subject = Transcriber(listener, speech_to_text)
+
+        actual = subject.read_detailed(n_transcriptions=7, segment_timestamps=False)
+
+        assert actual is detailed_transcription
+        speech_to_text.transcribe_audio_stream_detailed.assert_called_once_with(
+            audio_stream, n_transcriptions=7, segment_timestamps=False
+        )
+
+    @staticmethod
+    def test_read_transcribes_output_of_overridden_read_on_state_listener():
+        class StateListener(BaseStateListener):  # pylint: disable=too-few-public-methods
+            def read(self, n_frames=None):
+                return SILENCE_2S
+
+        speech_to_text = MagicMock()
+        speech_to_text.transcribe_audio_stream.side_effect = list
+        speech_to_text.transcribe_audio_stream_detailed.side_effect = lambda stream, **kwargs: list(stream)
+
+        subject = Transcriber(StateListener(MagicMock()), speech_to_text)
+
+        actual = subject.read()
+        actual_detailed = subject.read_detailed()
+
+        assert actual == [SILENCE_2S]
+        assert actual_detailed == [SILENCE_2S]
+
     @staticmethod
     def test_listener_works_as_audio_source():
         audio_source = MagicMock()
-        audio_samples = [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
-        audio_source.read = MagicMock(side_effect=audio_samples + [EOFError])
+        audio_samples = [SILENCE_1S, SILENCE_2S]
+        audio_source.read.side_effect = audio_samples + [EOFError]
         listener = Listener(audio_source)
 
         speech_to_text = MagicMock()
-        speech_to_text.transcribe_audio = MagicMock(return_value="any text")
+        speech_to_text.transcribe_audio.return_value = "any text"
 
         subject = Transcriber(listener, speech_to_text)
 
@@ -70,13 +128,13 @@ class TestTranscriber:
     @staticmethod
     def test_continuous_listener_works_as_audio_source():
         audio_source = MagicMock()
-        audio_samples = [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
-        audio_source.read = MagicMock(side_effect=audio_samples + [EOFError])
+        audio_samples = [SILENCE_1S, SILENCE_2S]
+        audio_source.read.side_effect = audio_samples + [EOFError]
         raw_listener = Listener(audio_source)
         listener = ContinuousListener(raw_listener)
 
         speech_to_text = MagicMock()
-        speech_to_text.transcribe_audio = MagicMock(return_value="any text")
+        speech_to_text.transcribe_audio.return_value = "any text"
 
         subject = Transcriber(listener, speech_to_text)
 
@@ -89,29 +147,28 @@ class TestTranscriber:
     @staticmethod
     def test_iterating_over_transcriber_returns_text_of_audio_recorded():
         audio_source = MagicMock()
-        audio_samples = [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
-        audio_source.read = MagicMock(side_effect=audio_samples + [EOFError])
+        audio_samples = [SILENCE_1S, SILENCE_2S]
+        audio_source.read.side_effect = audio_samples + [EOFError]
         listener = Listener(audio_source)
 
         speech_to_text = MagicMock()
-        speech_to_text.transcribe_audio = MagicMock(side_effect=["any text", "more text"])
+        speech_to_text.transcribe_audio.side_effect = ["any text", "more text"]
 
         subject = Transcriber(listener, speech_to_text)
 
         actual = list(subject)
 
-        assert speech_to_text.transcribe_audio.call_count == 2
-        speech_to_text.transcribe_audio.assert_has_calls([call(audio_samples[0]), call(audio_samples[1])])
+        assert speech_to_text.transcribe_audio.call_args_list == [call(audio_samples[0]), call(audio_samples[1])]
         assert actual == ["any text", "more text"]
 
     @staticmethod
     def test_empty_iterable_when_iterating_over_transcriber_with_no_audio():
         audio_source = MagicMock()
-        audio_source.read = MagicMock(side_effect=[EOFError])
+        audio_source.read.side_effect = [EOFError]
         listener = Listener(audio_source)
 
         speech_to_text = MagicMock()
-        speech_to_text.transcribe_audio = MagicMock(side_effect=["any text", "more text"])
+        speech_to_text.transcribe_audio.side_effect = ["any text", "more text"]
 
         subject = Transcriber(listener, speech_to_text)
 
@@ -122,8 +179,8 @@ class TestTranscriber:
     @staticmethod
     def test_iterating_over_transcriber_detailed_iter_returns_details_of_transcriptions():
         audio_source = MagicMock()
-        audio_samples = [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
-        audio_source.read = MagicMock(side_effect=audio_samples + [EOFError])
+        audio_samples = [SILENCE_1S, SILENCE_2S]
+        audio_source.read.side_effect = audio_samples + [EOFError]
         listener = Listener(audio_source)
 
         speech_to_text = MagicMock()
@@ -143,29 +200,25 @@ class TestTranscriber:
                 None,
             ),
         ]
-        speech_to_text.transcribe_audio_detailed = MagicMock(side_effect=detailed_transcripts)
+        speech_to_text.transcribe_audio_detailed.side_effect = detailed_transcripts
 
         subject = Transcriber(listener, speech_to_text)
 
         actual = list(subject.iter_detailed(n_transcriptions=2, segment_timestamps=False))
 
-        assert speech_to_text.transcribe_audio_detailed.call_count == 2
-        speech_to_text.transcribe_audio_detailed.assert_has_calls(
-            [
-                call(audio_samples[0], n_transcriptions=2, segment_timestamps=False),
-                call(audio_samples[1], n_transcriptions=2, segment_timestamps=False),
-            ]
-        )
+        assert speech_to_text.transcribe_audio_detailed.call_args_list == [
+            call(audio_samples[0], n_transcriptions=2, segment_timestamps=False),
+            call(audio_samples[1], n_transcriptions=2, segment_timestamps=False),
+        ]
         assert actual == detailed_transcripts
 
     @staticmethod
     def test_empty_iterable_when_iterating_over_detailed_iter_with_no_audio():
         audio_source = MagicMock()
-        audio_source.read = MagicMock(side_effect=[EOFError])
+        audio_source.read.side_effect = [EOFError]
         listener = Listener(audio_source)
 
         speech_to_text = MagicMock()
-        speech_to_text.transcribe_audio_detailed = MagicMock()
 
         subject = Transcriber(listener, speech_to_text)
 
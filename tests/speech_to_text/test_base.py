@@ -79,3 +79,52 @@ def test_base_speech_to_text_getting_best_transcribed_audio():
 
     assert "any transcript 1" == actual_transcript
     subject.transcribe_audio_detailed.assert_called_once_with(any_audio, n_transcriptions=1)
+
+
+def test_base_speech_to_text_transcribing_stream_joins_audio():
+    audio_stream = [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+    transcripts = base.DetailedTranscripts([base.DetailedTranscript("any transcript", 0.99, None)], None)
+    subject = base.BaseSpeechToText()
+    subject.transcribe_audio_detailed = mock.MagicMock(return_value=transcripts)
+
+    actual_transcripts = subject.transcribe_audio_stream_detailed(
+        iter(audio_stream), n_transcriptions=2, segment_timestamps=False
+    )
+
+    assert actual_transcripts is transcripts
+    subject.transcribe_audio_detailed.assert_called_once_with(
+        AudioSample.from_iterable(audio_stream), n_transcriptions=2, segment_timestamps=False
+    )
+
+
+def test_base_speech_to_text_transcribing_empty_stream():
+    subject = base.BaseSpeechToText()
+
+    with pytest.raises(base.NoTranscriptionError):
+        subject.transcribe_audio_stream([])
+
+
+def test_base_speech_to_text_transcribing_stream_uses_overridden_transcribe_audio():
+    class SpeechToText(base.BaseSpeechToText):
+        def transcribe_audio(self, audio):
+            return f"{audio.n_seconds:.0f} seconds of audio"
+
+    audio_stream = [AudioSample.generate_silence(1, 44100), AudioSample.generate_silence(2, 44100)]
+    subject = SpeechToText()
+    subject.transcribe_audio_stream_detailed = mock.MagicMock()
+
+    actual_transcript = subject.transcribe_audio_stream(iter(audio_stream))
+
+    assert actual_transcript == "3 seconds of audio"
+    subject.transcribe_audio_stream_detailed.assert_not_called()
+
+
+def test_base_speech_to_text_transcribing_empty_stream_with_overridden_transcribe_audio():
+    class SpeechToText(base.BaseSpeechToText):
+        def transcribe_audio(self, audio):
+            return "any text"
+
+    subject = SpeechToText()
+
+    with pytest.raises(base.NoTranscriptionError):
+        subject.transcribe_audio_stream([])
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import donkey_ears.speech_to_text
+
+REPOSITORY_ROOT = Path(__file__).parents[2]
+
+
+def test_importing_package_does_not_import_engines():
+    # Run in a fresh interpreter, since other tests will have already imported the engine modules
+    script = textwrap.dedent(
+        """
+        import sys
+
+        import donkey_ears.speech_to_text
+
+        engines = ["donkey_ears.speech_to_text.vosk", "donkey_ears.speech_to_text.coqui_stt"]
+        assert not any(engine in sys.modules for engine in engines), sys.modules.keys()
+
+        donkey_ears.speech_to_text.VoskSpeechToText
+
+        assert "donkey_ears.speech_to_text.vosk" in sys.modules
+        assert "donkey_ears.speech_to_text.coqui_stt" not in sys.modules
+        """
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False, cwd=REPOSITORY_ROOT
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_engine_class_is_loaded_on_access():
+    actual = donkey_ears.speech_to_text.VoskSpeechToText
+
+    assert actual is sys.modules["donkey_ears.speech_to_text.vosk"].VoskSpeechToText
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        donkey_ears.speech_to_text.NotAnEngine  # pylint: disable=pointless-statement
@@ -1,119 +1,178 @@
+import importlib.util
+import itertools
 import json
+import sys
 from unittest.mock import MagicMock, call
 
+import pytest
+
+from donkey_ears.audio.base import AudioSample
 from donkey_ears.speech_to_text import vosk
-from donkey_ears.speech_to_text.base import DetailedTranscript, DetailedTranscripts, TranscriptSegment
+from donkey_ears.speech_to_text.base import (
+    DetailedTranscript,
+    DetailedTranscripts,
+    NoTranscriptionError,
+    TranscriptSegment,
+)
+
+RAW_SEGMENTED_RESULT = {
+    "alternatives": [
+        {
+            "text": "first transcription",
+            "confidence": 0.99,
+            "result": [
+                {"word": "first", "start": 0, "end": 0.8},
+                {"word": "transcription", "start": 0.9, "end": 1.7},
+            ],
+        },
+        {
+            "text": "second transcription",
+            "confidence": 0.88,
+            "result": [
+                {"word": "second", "start": 0.1, "end": 1.1},
+                {"word": "transcription", "start": 1.3, "end": 2.2},
+            ],
+        },
+    ]
+}
+RAW_SEGMENTED_RESULT_JSON = json.dumps(RAW_SEGMENTED_RESULT)
+
+RAW_UNSEGMENTED_RESULT = {
+    "alternatives": [
+        {"text": "first transcription", "confidence": 0.99},
+        {"text": "second transcription", "confidence": 0.88},
+    ]
+}
+RAW_UNSEGMENTED_RESULT_JSON = json.dumps(RAW_UNSEGMENTED_RESULT)
+
+FIELD_CHANGES = [
+    ("model_path", "/path/to/different/model", "/path/to/model"),
+    ("frame_rate", 32_000, 16_000),
+    ("bit_depth", 8, 16),
+    ("n_channels", 2, 1),
+]
+FIELD_CHANGE_IDS = [field_name for field_name, _, _ in FIELD_CHANGES]
+
+# The grammar is built from a set, so any ordering of the vocabulary is valid
+GRAMMARS_WITHOUT_UNKNOWN = {json.dumps(list(words)) for words in itertools.permutations(["restrict", "to", "words"])}
+GRAMMARS_WITH_UNKNOWN = {
+    json.dumps(list(words)) for words in itertools.permutations(["restrict", "to", "words", "[unk]"])
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    vosk._MODEL_CACHE.clear()
+
+
+@pytest.fixture
+def vosk_mocks(monkeypatch):
+    mock_model_class = MagicMock()
+    mock_recognizer_class = MagicMock()
+    monkeypatch.setattr(vosk, "Model", mock_model_class)
+    monkeypatch.setattr(vosk, "KaldiRecognizer", mock_recognizer_class)
+    return mock_model_class, mock_recognizer_class
+
+
+@pytest.fixture
+def audio_mocks():
+    converted_audio = MagicMock()
+    converted_audio.to_bytes.return_value = b"audio in bytes"
+    audio = MagicMock()
+    audio.convert.return_value = converted_audio
+    return audio, converted_audio
+
+
+@pytest.fixture
+def subject_and_copy(vosk_mocks):
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+    return subject, subject.copy()
 
 
-def test_creating_instance_passes_correct_values_to_vosk():
+@pytest.mark.parametrize(
+    "model_path, frame_rate",
+    [("/path/to/model", 16_000), ("/path/to/other/model", 44_100)],
+    ids=["default model", "other model"],
+)
+def test_creating_instance_passes_correct_values_to_vosk(vosk_mocks, model_path, frame_rate):
     # Arrange
-    vosk.Model = MagicMock(return_value="any_model")
-    vosk.KaldiRecognizer = MagicMock()
+    mock_model_class, mock_recognizer_class = vosk_mocks
 
     # Act
-    vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+    vosk.VoskSpeechToText(model_path, frame_rate, 16, 1)
 
     # Assert
-    vosk.Model.assert_called_once_with("/path/to/model")
-    vosk.KaldiRecognizer.assert_called_once_with("any_model", 16_000)
+    assert mock_model_class.call_args_list == [call(model_path)]
+    assert mock_recognizer_class.call_args_list == [call(mock_model_class.return_value, frame_rate)]
 
 
-def test_changing_model_path_creates_new_model():
+def test_changing_model_path_creates_new_model(vosk_mocks):
     """Changing a field in the copy should not have an effect on the original"""
     # Arrange
-    vosk.Model = MagicMock(side_effect=["first model", "second model"])
-    vosk.KaldiRecognizer = MagicMock(side_effect=["first recognizer", "second recognizer"])
+    mock_model_class, mock_recognizer_class = vosk_mocks
+    first_model, second_model = MagicMock(), MagicMock()
+    mock_model_class.side_effect = [first_model, second_model]
+    mock_recognizer_class.side_effect = ["first recognizer", "second recognizer"]
     subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
 
     # Act
     subject.model_path = "/path/to/different/model"
 
     # Assert
-    vosk.Model.assert_has_calls([call("/path/to/model"), call("/path/to/different/model")])
-    assert vosk.Model.call_count == 2
-    vosk.KaldiRecognizer.assert_has_calls([call("first model", 16_000), call("second model", 16_000)])
-    assert vosk.KaldiRecognizer.call_count == 2
-    assert subject._model == "second model"
+    assert mock_model_class.call_args_list == [call("/path/to/model"), call("/path/to/different/model")]
+    assert mock_recognizer_class.call_args_list == [call(first_model, 16_000), call(second_model, 16_000)]
+    assert subject._model is second_model
     assert subject._recognizer == "second recognizer"
 
 
-def test_changing_field_in_copy_does_not_affect_original():
-    """Changing a field in the copy should not have an effect on the original"""
+def test_copy_shares_model_but_not_recognizer(vosk_mocks):
     # Arrange
-    vosk.Model = MagicMock()
-    vosk.KaldiRecognizer = MagicMock()
+    mock_model_class, mock_recognizer_class = vosk_mocks
+    mock_model_class.side_effect = lambda model_path: MagicMock()
+    mock_recognizer_class.side_effect = lambda model, frame_rate: MagicMock()
     subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
-    copy = subject.copy()
 
     # Act
-    copy.model_path = "/path/to/different/model"
-    copy.frame_rate = 32_000
-    copy.bit_depth = 8
-    copy.n_channels = 2
+    copy = subject.copy()
 
     # Assert
-    assert subject.model_path == "/path/to/model"
-    assert subject.frame_rate == 16_000
-    assert subject.bit_depth == 16
-    assert subject.n_channels == 1
+    mock_model_class.assert_called_once_with("/path/to/model")
+    assert copy._model is subject._model
+    assert copy._recognizer is not subject._recognizer
 
 
-def test_changing_field_in_original_does_not_affect_copy():
+@pytest.mark.parametrize("field_name, new_value, original_value", FIELD_CHANGES, ids=FIELD_CHANGE_IDS)
+def test_changing_field_in_copy_does_not_affect_original(subject_and_copy, field_name, new_value, original_value):
     """Changing a field in the copy should not have an effect on the original"""
     # Arrange
-    vosk.Model = MagicMock()
-    vosk.KaldiRecognizer = MagicMock()
-    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
-    copy = subject.copy()
+    subject, copy = subject_and_copy
 
     # Act
-    subject.model_path = "/path/to/different/model"
-    subject.frame_rate = 32_000
-    subject.bit_depth = 8
-    subject.n_channels = 2
+    setattr(copy, field_name, new_value)
 
     # Assert
-    assert copy.model_path == "/path/to/model"
-    assert copy.frame_rate == 16_000
-    assert copy.bit_depth == 16
-    assert copy.n_channels == 1
-
-
-def test_detailed_transcription_with_segments():
-    # Arrange
-    vosk.Model = MagicMock(return_value="first model")
-    mock_recognizer_instance = MagicMock()
-    vosk.KaldiRecognizer = MagicMock(return_value=mock_recognizer_instance)
-    mock_recognizer_instance.SetMaxAlternatives = MagicMock()
-    mock_recognizer_instance.SetWords = MagicMock()
-    mock_recognizer_instance.AcceptWaveform = MagicMock()
-    raw_final_result = {
-        "alternatives": [
-            {
-                "text": "first transcription",
-                "confidence": 0.99,
-                "result": [
-                    {"word": "first", "start": 0, "end": 0.8},
-                    {"word": "transcription", "start": 0.9, "end": 1.7},
-                ],
-            },
-            {
-                "text": "second transcription",
-                "confidence": 0.88,
-                "result": [
-                    {"word": "second", "start": 0.1, "end": 1.1},
-                    {"word": "transcription", "start": 1.3, "end": 2.2},
-                ],
-            },
-        ]
-    }
-    mock_recognizer_instance.FinalResult = MagicMock(return_value=json.dumps(raw_final_result))
-    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+    assert getattr(subject, field_name) == original_value
 
-    converted_audio = MagicMock()
-    converted_audio.to_bytes = MagicMock(return_value=b"audio in bytes")
-    audio = MagicMock()
-    audio.convert = MagicMock(return_value=converted_audio)
+
+@pytest.mark.parametrize("field_name, new_value, original_value", FIELD_CHANGES, ids=FIELD_CHANGE_IDS)
+def test_changing_field_in_original_does_not_affect_copy(subject_and_copy, field_name, new_value, original_value):
+    """Changing a field in the original should not have an effect on the copy"""
+    # Arrange
+    subject, copy = subject_and_copy
+
+    # Act
+    setattr(subject, field_name, new_value)
+
+    # Assert
+    assert getattr(copy, field_name) == original_value
+
+
+def test_detailed_transcription_with_segments(vosk_mocks, audio_mocks):
+    # Arrange
+    audio, _ = audio_mocks
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    mock_recognizer_instance.FinalResult.return_value = RAW_SEGMENTED_RESULT_JSON
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
 
     expected_transcriptions = DetailedTranscripts(
         [
@@ -128,7 +187,7 @@ def test_detailed_transcription_with_segments():
                 [TranscriptSegment("second", 0.1, 1.1), TranscriptSegment("transcription", 1.3, 2.2)],
             ),
         ],
-        raw_final_result,
+        RAW_SEGMENTED_RESULT,
     )
 
     # Act
@@ -146,34 +205,19 @@ def test_detailed_transcription_with_segments():
     assert expected_transcriptions == actual_transcriptions
 
 
-def test_detailed_transcription_with_no_segments():
-    # Arrange
-    vosk.Model = MagicMock(return_value="first model")
-    mock_recognizer_instance = MagicMock()
-    vosk.KaldiRecognizer = MagicMock(return_value=mock_recognizer_instance)
-    mock_recognizer_instance.SetMaxAlternatives = MagicMock()
-    mock_recognizer_instance.SetWords = MagicMock()
-    mock_recognizer_instance.AcceptWaveform = MagicMock()
-    raw_final_result = {
-        "alternatives": [
-            {"text": "first transcription", "confidence": 0.99},
-            {"text": "second transcription", "confidence": 0.88},
-        ]
-    }
-    mock_recognizer_instance.FinalResult = MagicMock(return_value=json.dumps(raw_final_result))
+def test_detailed_transcription_with_no_segments(vosk_mocks, audio_mocks):
+    # Arrange
+    audio, _ = audio_mocks
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    mock_recognizer_instance.FinalResult.return_value = RAW_UNSEGMENTED_RESULT_JSON
     subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
 
-    converted_audio = MagicMock()
-    converted_audio.to_bytes = MagicMock(return_value=b"audio in bytes")
-    audio = MagicMock()
-    audio.convert = MagicMock(return_value=converted_audio)
-
     expected_transcriptions = DetailedTranscripts(
         [
             DetailedTranscript("first transcription", 0.99, None),
             DetailedTranscript("second transcription", 0.88, None),
         ],
-        raw_final_result,
+        RAW_UNSEGMENTED_RESULT,
     )
 
     # Act
@@ -191,17 +235,116 @@ def test_detailed_transcription_with_no_segments():
     assert expected_transcriptions == actual_transcriptions
 
 
+def test_transcribing_stream_accepts_each_piece_of_audio(vosk_mocks):
+    # Arrange
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    raw_final_result = {"alternatives": [{"text": "first transcription", "confidence": 0.99}]}
+    mock_recognizer_instance.FinalResult.return_value = json.dumps(raw_final_result)
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+
+    audio_stream = []
+    for audio_bytes in (b"first piece", b"second piece"):
+        audio = MagicMock()
+        audio.frame_rate = 16_000
+        audio.convert.return_value.to_bytes.return_value = audio_bytes
+        audio_stream.append(audio)
+
+    # Act
+    actual_transcriptions = subject.transcribe_audio_stream_detailed(
+        iter(audio_stream), n_transcriptions=1, segment_timestamps=False
+    )
+
+    # Assert
+    assert mock_recognizer_instance.AcceptWaveform.call_args_list == [call(b"first piece"), call(b"second piece")]
+    mock_recognizer_instance.FinalResult.assert_called_once_with()
+    assert actual_transcriptions == DetailedTranscripts(
+        [DetailedTranscript("first transcription", 0.99, None)], raw_final_result
+    )
+
+
+def test_transcribing_stream_resamples_pieces_together(vosk_mocks):
+    # Arrange
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    mock_recognizer_instance.FinalResult.return_value = RAW_UNSEGMENTED_RESULT_JSON
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+    audio_stream = [AudioSample.generate_silence(1, 8_000), AudioSample.generate_silence(2, 8_000)]
+
+    # Act
+    subject.transcribe_audio_stream_detailed(iter(audio_stream))
+
+    # Assert
+    expected_audio = AudioSample.from_iterable(audio_stream).convert(frame_rate=16_000, sample_width=2, n_channels=1)
+    assert mock_recognizer_instance.AcceptWaveform.call_args_list == [call(expected_audio.to_bytes())]
+
+
+def test_transcribing_stream_uses_overridden_transcribe_audio_detailed(vosk_mocks):
+    # Arrange
+    class SpeechToText(vosk.VoskSpeechToText):
+        def transcribe_audio_detailed(self, audio, *, n_transcriptions=3, segment_timestamps=True):
+            return audio
+
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    subject = SpeechToText("/path/to/model", 16_000, 16, 1)
+    audio_stream = [AudioSample.generate_silence(1, 16_000), AudioSample.generate_silence(2, 16_000)]
+
+    # Act
+    actual = subject.transcribe_audio_stream_detailed(iter(audio_stream))
+
+    # Assert
+    assert actual == AudioSample.from_iterable(audio_stream)
+    mock_recognizer_instance.AcceptWaveform.assert_not_called()
+
+
+def test_transcribing_empty_stream_raises_no_transcription_error(vosk_mocks):
+    # Arrange
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+
+    # Act and Assert
+    with pytest.raises(NoTranscriptionError):
+        subject.transcribe_audio_stream_detailed(iter([]))
+
+    mock_recognizer_instance.FinalResult.assert_not_called()
+
+
+def test_recognizer_reset_when_stream_fails(vosk_mocks):
+    # Arrange
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+
+    def audio_stream():
+        yield MagicMock()
+        raise EOFError()
+
+    # Act
+    with pytest.raises(EOFError):
+        subject.transcribe_audio_stream_detailed(audio_stream())
+
+    # Assert
+    mock_recognizer_instance.Reset.assert_called_once_with()
+    mock_recognizer_instance.FinalResult.assert_not_called()
+
+
+def test_warm_up_decodes_silence_then_resets(vosk_mocks):
+    # Arrange
+    mock_recognizer_instance = vosk_mocks[1].return_value
+    subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+
+    # Act
+    subject.warm_up()
+
+    # Assert
+    assert mock_recognizer_instance.mock_calls == [call.AcceptWaveform(b"\x00" * 3_200), call.Reset()]
+
+
 def test_detailed_transcription_when_no_transcription_generated():
     # TODO
     pass
 
 
-def test_restricting_vocabulary_and_excluding_unknown_token():
+def test_restricting_vocabulary_and_excluding_unknown_token(vosk_mocks):
     # Arrange
-    vosk.Model = MagicMock()
-    mock_recognizer_instance = MagicMock()
-    vosk.KaldiRecognizer = MagicMock(return_value=mock_recognizer_instance)
-    mock_recognizer_instance.SetGrammar = MagicMock()
+    mock_recognizer_instance = vosk_mocks[1].return_value
     subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
 
     # Act
@@ -209,15 +352,12 @@ def test_restricting_vocabulary_and_excluding_unknown_token():
 
     # Assert
     mock_recognizer_instance.SetGrammar.assert_called_once()
-    assert set(json.loads(mock_recognizer_instance.SetGrammar.call_args[0][0])) == {"restrict", "to", "words"}
+    assert mock_recognizer_instance.SetGrammar.call_args[0][0] in GRAMMARS_WITHOUT_UNKNOWN
 
 
-def test_restricting_vocabulary_and_including_unknown_token():
+def test_restricting_vocabulary_and_including_unknown_token(vosk_mocks):
     # Arrange
-    vosk.Model = MagicMock()
-    mock_recognizer_instance = MagicMock()
-    vosk.KaldiRecognizer = MagicMock(return_value=mock_recognizer_instance)
-    mock_recognizer_instance.SetGrammar = MagicMock()
+    mock_recognizer_instance = vosk_mocks[1].return_value
     subject = vosk.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
 
     # Act
@@ -225,4 +365,32 @@ def test_restricting_vocabulary_and_including_unknown_token():
 
     # Assert
     mock_recognizer_instance.SetGrammar.assert_called_once()
-    assert set(json.loads(mock_recognizer_instance.SetGrammar.call_args[0][0])) == {"restrict", "to", "words", "[unk]"}
+    assert mock_recognizer_instance.SetGrammar.call_args[0][0] in GRAMMARS_WITH_UNKNOWN
+
+
+def test_results_parsed_with_orjson_when_installed():
+    orjson = pytest.importorskip("orjson")
+
+    assert vosk.json_loads is orjson.loads
+
+
+def test_results_parsed_with_json_when_orjson_not_installed(monkeypatch, audio_mocks):
+    # Arrange
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.find_spec(vosk.__name__)
+    vosk_without_orjson = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(vosk_without_orjson)
+
+    mock_recognizer_class = MagicMock()
+    mock_recognizer_class.return_value.FinalResult.return_value = RAW_UNSEGMENTED_RESULT_JSON
+    monkeypatch.setattr(vosk_without_orjson, "Model", MagicMock())
+    monkeypatch.setattr(vosk_without_orjson, "KaldiRecognizer", mock_recognizer_class)
+    subject = vosk_without_orjson.VoskSpeechToText("/path/to/model", 16_000, 16, 1)
+    audio, _ = audio_mocks
+
+    # Act
+    actual_transcriptions = subject.transcribe_audio_detailed(audio, n_transcriptions=2, segment_timestamps=False)
+
+    # Assert
+    assert vosk_without_orjson.json_loads is json.loads
+    assert actual_transcriptions.raw_model_response == RAW_UNSEGMENTED_RESULT